@@ -26,26 +26,29 @@ Exceptions:
     TimeoutError: Execution timed out (also accessible as eryx.TimeoutError).
 """
 
-from eryx._eryx import (
-    # Classes
-    CallbackRegistry,
-    # Exceptions
-    EryxError,
-    ExecuteResult,
-    ExecutionError,
-    InitializationError,
-    MCPManager,
-    NetConfig,
-    ResourceLimitError,
-    ResourceLimits,
-    Sandbox,
-    SandboxFactory,
-    Session,
-    TimeoutError,
-    VfsStorage,
-    # Module metadata
-    __version__,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from eryx._eryx import (
+        # Classes
+        CallbackRegistry,
+        # Exceptions
+        EryxError,
+        ExecuteResult,
+        ExecutionError,
+        InitializationError,
+        MCPManager,
+        NetConfig,
+        ResourceLimitError,
+        ResourceLimits,
+        Sandbox,
+        SandboxFactory,
+        Session,
+        TimeoutError,
+        VfsStorage,
+        # Module metadata
+        __version__,
+    )
 
 __all__ = [
     # Classes
@@ -67,3 +70,20 @@ __all__ = [
     # Metadata
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # The native extension bundles the Wasmtime engine and embedded runtime,
+    # so it is loaded on first use rather than at import time. This keeps
+    # `eryx --help` and other paths that never touch a sandbox fast.
+    if name in __all__:
+        import importlib
+
+        value = getattr(importlib.import_module("eryx._eryx"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module 'eryx' has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
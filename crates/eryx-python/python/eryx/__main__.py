@@ -18,35 +18,92 @@ from __future__ import annotations
 
 import argparse
 import sys
-import textwrap
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 
 import eryx
 
-from eryx._cli import add_sandbox_args, make_mcp_manager, make_net_config, make_resource_limits
+from eryx._cli import (
+    SandboxArgs,
+    add_sandbox_args,
+    make_mcp_manager,
+    make_net_config,
+    make_resource_limits,
+)
+
+
+_EPILOG = (
+    "examples:\n"
+    "  eryx                              interactive REPL\n"
+    "  eryx script.py                    execute a file\n"
+    "  eryx -c 'print(\"hello\")'          execute a string\n"
+    "  echo 'print(1+1)' | eryx -        read code from stdin\n"
+    "  eryx --timeout 5000 script.py     set execution timeout\n"
+    "  eryx --net -c 'import requests'   enable network access\n"
+    "  eryx serve                        start MCP server\n"
+    "  eryx serve --mcp                  MCP server with inner tools\n"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _CliArgs(SandboxArgs):
+    """Parsed ``eryx`` arguments."""
+
+    command: str | None = None
+    script: str | None = None
+
+    @classmethod
+    def from_namespace(cls, ns: argparse.Namespace) -> _CliArgs:
+        return cls(
+            command=ns.command,
+            script=ns.script,
+            timeout=ns.timeout,
+            max_memory=ns.max_memory,
+            net=ns.net,
+            allow_host=tuple(ns.allow_host),
+            mcp=ns.mcp,
+            mcp_config=tuple(ns.mcp_config),
+            volume=tuple(ns.volume),
+        )
+
+
+class _VersionAction(argparse.Action):
+    """Print the version without loading the native extension."""
+
+    def __init__(
+        self,
+        option_strings: list[str],
+        dest: str = argparse.SUPPRESS,
+        default: str = argparse.SUPPRESS,
+        help: str = "show program's version number and exit",
+    ) -> None:
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None) -> None:  # type: ignore[override]
+        # Read the installed distribution's metadata; eryx.__version__ would load
+        # the native extension just to print a string.
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            eryx_version = version("pyeryx")
+        except PackageNotFoundError:
+            eryx_version = eryx.__version__
+        print(f"{parser.prog} {eryx_version}")
+        parser.exit()
 
 
-def _build_parser() -> argparse.ArgumentParser:
+def _build_parser(argv: Sequence[str] | None = None) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="eryx",
         description="Run Python code in an Eryx WebAssembly sandbox.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=textwrap.dedent("""\
-            examples:
-              eryx                              interactive REPL
-              eryx script.py                    execute a file
-              eryx -c 'print("hello")'          execute a string
-              echo 'print(1+1)' | eryx -        read code from stdin
-              eryx --timeout 5000 script.py     set execution timeout
-              eryx --net -c 'import requests'   enable network access
-              eryx serve                        start MCP server
-              eryx serve --mcp                  MCP server with inner tools
-        """),
+        epilog=_EPILOG,
     )
 
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {eryx.__version__}",
+        action=_VersionAction,
     )
 
     # --- code source (mutually exclusive) ---
@@ -64,24 +121,66 @@ def _build_parser() -> argparse.ArgumentParser:
         help="Python file to execute (use '-' for stdin)",
     )
 
-    add_sandbox_args(parser)
+    add_sandbox_args(parser, argv)
 
     return parser
 
 
+def _fast_parse(argv: list[str]) -> _CliArgs | None:
+    """Parse the common invocations without building the argparse parser.
+
+    Handles no arguments, ``-c CODE``, ``-`` and a lone script path. Anything
+    else returns None and goes through the full parser.
+    """
+    if not argv:
+        command, script = None, None
+    elif len(argv) == 2 and argv[0] == "-c" and not argv[1].startswith("-"):
+        command, script = argv[1], None
+    elif len(argv) == 1 and (argv[0] == "-" or not argv[0].startswith("-")):
+        command, script = None, argv[0]
+    else:
+        return None
+    return _CliArgs(command=command, script=script)
+
+
+def _read_stdin() -> str:
+    """Read all of stdin as UTF-8 source.
+
+    Reads the binary buffer in one call, which sizes the read from ``fstat``
+    for redirected files, instead of decoding through the text wrapper.
+    """
+    return sys.stdin.buffer.read().decode("utf-8")
+
+
 def _write_stdout(chunk: str) -> None:
-    """Stream stdout chunks to the terminal in real-time."""
+    """Stream stdout chunks to the terminal, flushing at line boundaries.
+
+    Partial lines (e.g. ``print(x, end="")`` in a loop) stay in the stream
+    buffer until a newline arrives or the execution ends, instead of costing
+    a flush per chunk.
+    """
     sys.stdout.write(chunk)
-    sys.stdout.flush()
+    if "\n" in chunk:
+        sys.stdout.flush()
 
 
 def _write_stderr(chunk: str) -> None:
-    """Stream stderr chunks to the terminal in real-time."""
+    """Stream stderr chunks to the terminal, flushing at line boundaries."""
     sys.stderr.write(chunk)
-    sys.stderr.flush()
+    if "\n" in chunk:
+        sys.stderr.flush()
 
 
-def _run_once(code: str, args: argparse.Namespace, mcp_manager: object | None = None) -> int:
+def _execute(target: eryx.Sandbox | eryx.Session, code: str) -> None:
+    """Execute code on a Sandbox or Session, then flush any partial output."""
+    try:
+        target.execute(code)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def _run_once(code: str, args: _CliArgs, mcp_manager: object | None = None) -> int:
     """Execute code in a stateless Sandbox and print the result."""
     limits = make_resource_limits(args)
     net = make_net_config(args)
@@ -99,9 +198,11 @@ def _run_once(code: str, args: argparse.Namespace, mcp_manager: object | None =
     kwargs["on_stdout"] = _write_stdout
     kwargs["on_stderr"] = _write_stderr
 
+    # Sandbox() already reuses the process-wide engine and linked embedded
+    # runtime; a SandboxFactory would add a ~2s snapshot build for no gain.
     sandbox = eryx.Sandbox(**kwargs)
     try:
-        sandbox.execute(code)
+        _execute(sandbox, code)
     except eryx.TimeoutError as exc:
         print(f"eryx: timeout: {exc}", file=sys.stderr)
         return 1
@@ -118,7 +219,40 @@ def _run_once(code: str, args: argparse.Namespace, mcp_manager: object | None =
     return 0
 
 
-def _repl(args: argparse.Namespace, mcp_manager: object | None = None) -> int:
+def _start_session(kwargs: dict) -> Callable[[], eryx.Session | None]:
+    """Create an ``eryx.Session`` on a worker thread.
+
+    Returns a function that waits for the session and returns it. Loading the
+    runtime then overlaps with the banner and the user typing the first line.
+    If creation failed, the error is reported on stderr (once) and the
+    function returns None.
+    """
+    outcome: list[eryx.Session | BaseException | None] = []
+
+    def create() -> None:
+        try:
+            outcome.append(eryx.Session(**kwargs))
+        except BaseException as exc:
+            outcome.append(exc)
+
+    thread = threading.Thread(target=create, name="eryx-session", daemon=True)
+    thread.start()
+
+    def wait() -> eryx.Session | None:
+        thread.join()
+        result = outcome[0]
+        if isinstance(result, Exception):
+            outcome[0] = None
+            print(f"{type(result).__name__}: {result}", file=sys.stderr)
+            return None
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    return wait
+
+
+def _repl(args: _CliArgs, mcp_manager: object | None = None) -> int:
     """Run an interactive REPL using Session for persistent state."""
     kwargs = {}
     limits = make_resource_limits(args)
@@ -136,58 +270,73 @@ def _repl(args: argparse.Namespace, mcp_manager: object | None = None) -> int:
     kwargs["on_stdout"] = _write_stdout
     kwargs["on_stderr"] = _write_stderr
 
-    session = eryx.Session(**kwargs)
+    wait_for_session = _start_session(kwargs)
+    session = None
 
-    print(f"Eryx {eryx.__version__} (sandbox REPL)")
-    print('Type "exit()" or Ctrl-D to quit.')
+    sys.stdout.write(f'Eryx {eryx.__version__} (sandbox REPL)\nType "exit()" or Ctrl-D to quit.\n')
 
     buf: list[str] = []
     prompt = ">>> "
 
-    while True:
-        try:
-            line = input(prompt)
-        except (EOFError, KeyboardInterrupt):
-            if buf:
-                buf.clear()
-                prompt = ">>> "
+    try:
+        while True:
+            try:
+                line = input(prompt)
+            except (EOFError, KeyboardInterrupt):
+                if buf:
+                    buf.clear()
+                    prompt = ">>> "
+                    print()
+                    continue
                 print()
-                continue
-            print()
-            break
+                break
 
-        if not buf and line.strip() == "exit()":
-            break
+            if not buf and line.strip() == "exit()":
+                break
 
-        buf.append(line)
+            buf.append(line)
 
-        # Detect multi-line blocks: if the line ends with ':', or we're
-        # already in a continuation and the line is indented / blank,
-        # keep collecting.
-        if line.rstrip().endswith(":") or (len(buf) > 1 and (line.startswith((" ", "\t")) or line.strip() == "")):
-            prompt = "... "
-            continue
+            # Detect multi-line blocks: if the line ends with ':', or we're
+            # already in a continuation and the line is indented / blank,
+            # keep collecting. One rstrip() answers both the colon and the
+            # blank-line checks.
+            stripped = line.rstrip()
+            if stripped.endswith(":") or (len(buf) > 1 and (not stripped or line[:1] in (" ", "\t"))):
+                prompt = "... "
+                continue
 
-        code = "\n".join(buf)
-        buf.clear()
-        prompt = ">>> "
+            code = "\n".join(buf)
+            buf.clear()
+            prompt = ">>> "
 
-        try:
-            session.execute(code)
-        except eryx.TimeoutError as exc:
-            print(f"TimeoutError: {exc}", file=sys.stderr)
-            continue
-        except eryx.ResourceLimitError as exc:
-            print(f"ResourceLimitError: {exc}", file=sys.stderr)
-            continue
-        except eryx.ExecutionError as exc:
-            print(f"{exc}", file=sys.stderr)
-            continue
-        except eryx.EryxError as exc:
-            print(f"EryxError: {exc}", file=sys.stderr)
-            continue
+            if session is None:
+                session = wait_for_session()
+                if session is None:
+                    return 1
 
-    return 0
+            try:
+                _execute(session, code)
+            except eryx.TimeoutError as exc:
+                print(f"TimeoutError: {exc}", file=sys.stderr)
+                continue
+            except eryx.ResourceLimitError as exc:
+                print(f"ResourceLimitError: {exc}", file=sys.stderr)
+                continue
+            except eryx.ExecutionError as exc:
+                print(f"{exc}", file=sys.stderr)
+                continue
+            except eryx.EryxError as exc:
+                print(f"EryxError: {exc}", file=sys.stderr)
+                continue
+    finally:
+        # Always wait for the session, even on an exit before the first
+        # execute: creation errors still get reported, and the MCP manager
+        # that main() closes afterwards outlives the session being built
+        # with it.
+        if session is None:
+            session = wait_for_session()
+
+    return 0 if session is not None else 1
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -199,8 +348,10 @@ def main(argv: list[str] | None = None) -> int:
 
         return serve(raw_args[1:])
 
-    parser = _build_parser()
-    args = parser.parse_args(argv)
+    args = _fast_parse(raw_args)
+    if args is None:
+        parser = _build_parser(raw_args)
+        args = _CliArgs.from_namespace(parser.parse_args(raw_args))
 
     # Create MCP manager if requested
     mcp_manager = make_mcp_manager(args)
@@ -213,11 +364,12 @@ def main(argv: list[str] | None = None) -> int:
         # script file or stdin
         if args.script is not None:
             if args.script == "-":
-                code = sys.stdin.read()
+                code = _read_stdin()
             else:
                 try:
-                    with open(args.script) as f:
-                        code = f.read()
+                    # Unbuffered binary read: one fstat-sized read, no text layer
+                    with open(args.script, "rb", buffering=0) as f:
+                        code = f.read().decode("utf-8")
                 except FileNotFoundError:
                     print(f"eryx: {args.script}: No such file", file=sys.stderr)
                     return 1
@@ -231,11 +383,11 @@ def main(argv: list[str] | None = None) -> int:
             return _repl(args, mcp_manager)
 
         # piped input without '-' — read stdin anyway
-        code = sys.stdin.read()
+        code = _read_stdin()
         if code.strip():
             return _run_once(code, args, mcp_manager)
 
-        parser.print_help()
+        _build_parser().print_help()
         return 0
     finally:
         if mcp_manager is not None:
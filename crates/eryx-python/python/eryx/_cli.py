@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import argparse
+from collections.abc import Sequence
+from dataclasses import dataclass
 
 import eryx
 
@@ -12,80 +14,145 @@ def parse_volume(spec: str) -> tuple[str, str, bool]:
 
     Handles Windows drive letters (e.g. C:\\Users\\foo:/mnt/data).
     """
-    parts = spec.split(":")
-    # Rejoin Windows drive letter (e.g. ["C", "\\Users\\foo", "/mnt", ...])
-    if len(parts) >= 2 and len(parts[0]) == 1 and parts[0].isalpha():
-        parts = [parts[0] + ":" + parts[1]] + parts[2:]
-    if len(parts) == 2:
-        return (parts[0], parts[1], False)
-    if len(parts) == 3 and parts[2] in ("ro", "rw"):
-        return (parts[0], parts[1], parts[2] == "ro")
+    # Skip past a Windows drive letter when looking for the SRC separator
+    start = 2 if len(spec) >= 2 and spec[1] == ":" and spec[0].isalpha() else 0
+    sep = spec.find(":", start)
+    if sep >= 0:
+        dst, colon, mode = spec[sep + 1 :].partition(":")
+        if not colon:
+            return (spec[:sep], dst, False)
+        if mode in ("ro", "rw"):
+            return (spec[:sep], dst, mode == "ro")
     raise argparse.ArgumentTypeError(
         f"invalid volume format '{spec}', expected SRC:DST or SRC:DST:ro"
     )
 
 
-def add_sandbox_args(parser: argparse.ArgumentParser) -> None:
-    """Add the standard sandbox configuration argument groups to a parser."""
-    limits = parser.add_argument_group("resource limits")
-    limits.add_argument(
-        "--timeout",
-        type=int,
-        default=None,
-        metavar="MS",
-        help="execution timeout in milliseconds (default: 30000)",
-    )
-    limits.add_argument(
-        "--max-memory",
-        type=int,
-        default=None,
-        metavar="BYTES",
-        help="maximum memory in bytes (default: 128MB)",
-    )
+@dataclass(frozen=True, slots=True)
+class SandboxArgs:
+    """Sandbox flags from add_sandbox_args, frozen after parsing.
 
-    net = parser.add_argument_group("networking")
-    net.add_argument(
-        "--net",
-        action="store_true",
-        default=False,
-        help="enable network access",
-    )
-    net.add_argument(
-        "--allow-host",
-        action="append",
-        default=[],
-        metavar="PATTERN",
-        help="allow network access to hosts matching PATTERN (implies --net)",
-    )
+    Defaults match the parser's, so ``SandboxArgs()`` is what an argv with
+    none of these flags parses to.
+    """
 
-    mcp_group = parser.add_argument_group("MCP (Model Context Protocol)")
-    mcp_group.add_argument(
-        "--mcp",
-        action="store_true",
-        default=False,
-        help="enable MCP server integration (discovers servers from Claude, Cursor, VS Code, Zed, Windsurf, Codex, Gemini configs)",
-    )
-    mcp_group.add_argument(
-        "--mcp-config",
-        action="append",
-        default=[],
-        metavar="PATH",
-        help="path to MCP config file (implies --mcp, can be repeated)",
-    )
+    timeout: int | None = None
+    max_memory: int | None = None
+    net: bool = False
+    allow_host: tuple[str, ...] = ()
+    mcp: bool = False
+    mcp_config: tuple[str, ...] = ()
+    volume: tuple[tuple[str, str, bool], ...] = ()
 
-    fs = parser.add_argument_group("filesystem")
-    fs.add_argument(
-        "-v",
-        "--volume",
-        action="append",
-        default=[],
-        type=parse_volume,
-        metavar="SRC:DST[:ro]",
-        help="mount host directory SRC at sandbox path DST (append :ro for read-only)",
-    )
+
+# Option strings for each group added by add_sandbox_args.
+_LIMITS_OPTIONS = ("--timeout", "--max-memory")
+_NET_OPTIONS = ("--net", "--allow-host")
+_MCP_OPTIONS = ("--mcp", "--mcp-config")
+_FS_OPTIONS = ("-v", "--volume")
+_HELP_OPTIONS = ("-h", "--help")
 
 
-def make_resource_limits(args: argparse.Namespace) -> eryx.ResourceLimits | None:
+def _mentions(argv: Sequence[str] | None, options: Sequence[str]) -> bool:
+    """Return True if any token in *argv* could select one of *options*.
+
+    Errs on the side of True: long options match by prefix (argparse accepts
+    unambiguous abbreviations) and short options match attached values such
+    as ``-vSRC:DST``. ``None`` means the real argv is unknown.
+    """
+    if argv is None:
+        return True
+    for arg in argv:
+        if arg.startswith("--"):
+            name = arg.partition("=")[0]
+            if any(opt.startswith(name) for opt in options if opt.startswith("--")):
+                return True
+        elif arg.startswith("-") and arg[:2] in options:
+            return True
+    return False
+
+
+def add_sandbox_args(parser: argparse.ArgumentParser, argv: Sequence[str] | None = None) -> None:
+    """Add the standard sandbox configuration argument groups to a parser.
+
+    When *argv* is given, groups whose flags cannot appear in it are not
+    built; their defaults are set on the parser instead so the parsed
+    namespace looks the same. ``-h``/``--help`` always builds every group.
+    """
+    if _mentions(argv, _HELP_OPTIONS):
+        argv = None
+
+    if _mentions(argv, _LIMITS_OPTIONS):
+        limits = parser.add_argument_group("resource limits")
+        limits.add_argument(
+            "--timeout",
+            type=int,
+            default=None,
+            metavar="MS",
+            help="execution timeout in milliseconds (default: 30000)",
+        )
+        limits.add_argument(
+            "--max-memory",
+            type=int,
+            default=None,
+            metavar="BYTES",
+            help="maximum memory in bytes (default: 128MB)",
+        )
+    else:
+        parser.set_defaults(timeout=None, max_memory=None)
+
+    if _mentions(argv, _NET_OPTIONS):
+        net = parser.add_argument_group("networking")
+        net.add_argument(
+            "--net",
+            action="store_true",
+            default=False,
+            help="enable network access",
+        )
+        net.add_argument(
+            "--allow-host",
+            action="append",
+            default=[],
+            metavar="PATTERN",
+            help="allow network access to hosts matching PATTERN (implies --net)",
+        )
+    else:
+        parser.set_defaults(net=False, allow_host=[])
+
+    if _mentions(argv, _MCP_OPTIONS):
+        mcp_group = parser.add_argument_group("MCP (Model Context Protocol)")
+        mcp_group.add_argument(
+            "--mcp",
+            action="store_true",
+            default=False,
+            help="enable MCP server integration (discovers servers from Claude, Cursor, VS Code, Zed, Windsurf, Codex, Gemini configs)",
+        )
+        mcp_group.add_argument(
+            "--mcp-config",
+            action="append",
+            default=[],
+            metavar="PATH",
+            help="path to MCP config file (implies --mcp, can be repeated)",
+        )
+    else:
+        parser.set_defaults(mcp=False, mcp_config=[])
+
+    if _mentions(argv, _FS_OPTIONS):
+        fs = parser.add_argument_group("filesystem")
+        fs.add_argument(
+            "-v",
+            "--volume",
+            action="append",
+            default=[],
+            type=parse_volume,
+            metavar="SRC:DST[:ro]",
+            help="mount host directory SRC at sandbox path DST (append :ro for read-only)",
+        )
+    else:
+        parser.set_defaults(volume=[])
+
+
+def make_resource_limits(args: argparse.Namespace | SandboxArgs) -> eryx.ResourceLimits | None:
     """Build ResourceLimits from parsed CLI args, or None if defaults."""
     if args.timeout is None and args.max_memory is None:
         return None
@@ -97,7 +164,7 @@ def make_resource_limits(args: argparse.Namespace) -> eryx.ResourceLimits | None
     return limits
 
 
-def make_net_config(args: argparse.Namespace) -> eryx.NetConfig | None:
+def make_net_config(args: argparse.Namespace | SandboxArgs) -> eryx.NetConfig | None:
     """Build NetConfig from parsed CLI args, or None if networking is disabled."""
     if not args.net and not args.allow_host:
         return None
@@ -107,7 +174,7 @@ def make_net_config(args: argparse.Namespace) -> eryx.NetConfig | None:
     return config
 
 
-def make_mcp_manager(args: argparse.Namespace) -> object | None:
+def make_mcp_manager(args: argparse.Namespace | SandboxArgs) -> object | None:
     """Create an MCP manager if --mcp or --mcp-config is specified."""
     if not args.mcp and not args.mcp_config:
         return None
@@ -88,6 +88,29 @@ class MCPManager:
         """
         ...
 
+    def connect_all(
+        self,
+        servers: list[tuple[str, str, list[str], dict[str, str]]],
+        timeout_secs: float = 30.0,
+    ) -> list[tuple[str, int | InitializationError]]:
+        """Connect to several MCP servers concurrently.
+
+        Each server is spawned and handshaken in parallel, so the total time
+        is roughly that of the slowest server rather than the sum. Servers
+        that connect are added in the order given, as if ``connect`` had been
+        called for each in turn.
+
+        Args:
+            servers: A list of ``(name, command, args, env)`` tuples.
+            timeout_secs: Timeout in seconds for each connection handshake.
+
+        Returns:
+            A list of ``(name, result)`` pairs in the same order as
+            ``servers``, where ``result`` is the server's tool count on
+            success or the ``InitializationError`` describing why it failed.
+        """
+        ...
+
     def list_tools(self) -> list[dict[str, Any]]:
         """List all available tools across all connected servers.
 
@@ -32,17 +32,34 @@ Example:
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
+import mmap
 import os
 import re
+import stat
 import sys
-import tomllib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional, Sequence
 
 from eryx._eryx import MCPManager as _RustMCPManager
 
+try:
+    # Optional: orjson parses config files faster when it's installed, and
+    # unlike json.loads it accepts any buffer, so large files can be mmapped.
+    from orjson import loads as _json_loads
+
+    _JSON_LOADS_BUFFERS = True
+except ImportError:
+    from json import loads as _json_loads
+
+    _JSON_LOADS_BUFFERS = False
+
+# JSON configs at least this large are parsed from an mmap when possible
+# (~/.claude.json in particular grows with per-project history).
+_MMAP_THRESHOLD = 64 * 1024
+
 
 @dataclass(frozen=True)
 class _ConfigSource:
@@ -51,28 +68,68 @@ class _ConfigSource:
     path: Path
     key: str
     fmt: str = "json"  # "json" or "toml"
+    # Directory *path* lives under; its listing is checked before stat'ing.
+    root: Path | None = None
 
 
-def _default_sources() -> list[_ConfigSource]:
+def _default_sources() -> tuple[_ConfigSource, ...]:
     """Return the default config sources to search."""
-    home = Path.home()
-    cwd = Path.cwd()
-    return [
+    return _sources_for(os.path.expanduser("~"), os.getcwd())
+
+
+@functools.lru_cache(maxsize=8)
+def _sources_for(home_dir: str, cwd_dir: str) -> tuple[_ConfigSource, ...]:
+    home = Path(home_dir)
+    cwd = Path(cwd_dir)
+    return (
         # Global (user-wide) configs
-        _ConfigSource(home / ".claude.json", "mcpServers"),
-        _ConfigSource(home / ".cursor" / "mcp.json", "mcpServers"),
-        _ConfigSource(home / ".codeium" / "windsurf" / "mcp_config.json", "mcpServers"),
-        _ConfigSource(home / ".config" / "zed" / "settings.json", "context_servers"),
-        _ConfigSource(home / ".gemini" / "settings.json", "mcpServers"),
-        _ConfigSource(home / ".codex" / "config.toml", "mcp_servers", "toml"),
+        _ConfigSource(home / ".claude.json", "mcpServers", root=home),
+        _ConfigSource(home / ".cursor" / "mcp.json", "mcpServers", root=home),
+        _ConfigSource(
+            home / ".codeium" / "windsurf" / "mcp_config.json", "mcpServers", root=home
+        ),
+        _ConfigSource(
+            home / ".config" / "zed" / "settings.json", "context_servers", root=home
+        ),
+        _ConfigSource(home / ".gemini" / "settings.json", "mcpServers", root=home),
+        _ConfigSource(
+            home / ".codex" / "config.toml", "mcp_servers", "toml", root=home
+        ),
         # Project (cwd-relative) configs — later overrides earlier
-        _ConfigSource(cwd / ".mcp.json", "mcpServers"),
-        _ConfigSource(cwd / ".cursor" / "mcp.json", "mcpServers"),
-        _ConfigSource(cwd / ".vscode" / "mcp.json", "servers"),
-        _ConfigSource(cwd / ".zed" / "settings.json", "context_servers"),
-        _ConfigSource(cwd / ".gemini" / "settings.json", "mcpServers"),
-        _ConfigSource(cwd / ".codex" / "config.toml", "mcp_servers", "toml"),
-    ]
+        _ConfigSource(cwd / ".mcp.json", "mcpServers", root=cwd),
+        _ConfigSource(cwd / ".cursor" / "mcp.json", "mcpServers", root=cwd),
+        _ConfigSource(cwd / ".vscode" / "mcp.json", "servers", root=cwd),
+        _ConfigSource(cwd / ".zed" / "settings.json", "context_servers", root=cwd),
+        _ConfigSource(cwd / ".gemini" / "settings.json", "mcpServers", root=cwd),
+        _ConfigSource(cwd / ".codex" / "config.toml", "mcp_servers", "toml", root=cwd),
+    )
+
+
+_ENV_VAR_RE = re.compile(
+    r"\$(?:"
+    r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|"
+    r"\{(?P<brace>[A-Za-z_][A-Za-z0-9_]*)\}"
+    r"|"
+    r"\{(?P<defname>[A-Za-z_][A-Za-z0-9_]*):-(?P<default>[^}]*)\}"
+    r")"
+)
+
+_SIMPLE_VAR_RE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def _replace_simple_var(m: re.Match[str]) -> str:
+    return os.environ.get(m.group(1), "")
+
+
+def _replace_env_var(m: re.Match[str]) -> str:
+    name = m.group("name") or m.group("brace")
+    if name:
+        return os.environ.get(name, "")
+    # ${VAR:-default} form
+    name_with_default = m.group("defname")
+    default = m.group("default") or ""
+    return os.environ.get(name_with_default, "") or default
 
 
 def _expand_env_vars(value: str) -> str:
@@ -82,40 +139,47 @@ def _expand_env_vars(value: str) -> str:
     - ``$VAR`` and ``${VAR}`` — standard expansion
     - ``${VAR:-default}`` — default value if unset or empty
     """
+    if "$" not in value:
+        return value
+    if "${" not in value:
+        # Only the bare $VAR form can match; skip the alternation.
+        return _SIMPLE_VAR_RE.sub(_replace_simple_var, value)
+    return _ENV_VAR_RE.sub(_replace_env_var, value)
 
-    def _replace(m: re.Match[str]) -> str:
-        name = m.group("name") or m.group("brace")
-        if name:
-            return os.environ.get(name, "")
-        # ${VAR:-default} form
-        name_with_default = m.group("defname")
-        default = m.group("default") or ""
-        return os.environ.get(name_with_default, "") or default
-
-    pattern = (
-        r"\$(?:"
-        r"(?P<name>[A-Za-z_][A-Za-z0-9_]*)"
-        r"|"
-        r"\{(?P<brace>[A-Za-z_][A-Za-z0-9_]*)\}"
-        r"|"
-        r"\{(?P<defname>[A-Za-z_][A-Za-z0-9_]*):-(?P<default>[^}]*)\}"
-        r")"
-    )
-    return re.sub(pattern, _replace, value)
+
+def _expand_env_dict(env: dict[str, Any] | None) -> dict[str, str]:
+    """Expand environment variables in every value of a server's env block."""
+    if not env:
+        return {}
+    # JSON/TOML values are nearly always strings already.
+    return {
+        k: _expand_env_vars(v if type(v) is str else str(v)) for k, v in env.items()
+    }
 
 
 def _read_json(path: Path) -> dict[str, Any] | None:
     """Read a JSON file, returning None on any error."""
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        with path.open("rb") as f:
+            if _JSON_LOADS_BUFFERS and os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+                with (
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+                    memoryview(mm) as view,
+                ):
+                    return _json_loads(view)
+            return _json_loads(f.read())
+    except (OSError, ValueError):
         return None
 
 
 def _read_toml(path: Path) -> dict[str, Any] | None:
     """Read a TOML file, returning None on any error."""
+    # Imported here: most discovery runs read no TOML files at all.
+    import tomllib
+
     try:
-        return tomllib.loads(path.read_text(encoding="utf-8"))
+        with path.open("rb") as f:
+            return tomllib.load(f)
     except (OSError, tomllib.TOMLDecodeError, UnicodeDecodeError):
         return None
 
@@ -141,33 +205,97 @@ def _extract_stdio_servers(
     for name, config in mcp_servers.items():
         if not isinstance(config, dict):
             continue
-        if config.get("disabled", False):
-            continue
-        if config.get("enabled") is False:
-            continue
-
-        server_type = config.get("type", "stdio")
-        if server_type != "stdio":
-            continue
-
-        # Skip remote-only entries (no command, only url)
-        if not config.get("command"):
-            if config.get("url") or config.get("serverUrl") or config.get("httpUrl"):
-                continue
-
-        command = config.get("command")
-        if not command:
+        get = config.get
+        command = get("command")
+        # Remote-only entries (url/serverUrl/httpUrl) have no command, so
+        # the command check skips them too.
+        if (
+            not command
+            or get("disabled", False)
+            or get("enabled") is False
+            or get("type", "stdio") != "stdio"
+        ):
             continue
 
         servers[name] = {
             "command": command,
-            "args": config.get("args", []),
-            "env": config.get("env", {}),
+            "args": get("args", []),
+            "env": get("env", {}),
         }
 
     return servers
 
 
+_Stamp = tuple[int, int, int, bool]
+
+
+def _stat_stamp(path: Path) -> _Stamp | None:
+    """Return ``(size, mtime_ns, inode, is_regular)`` for *path*.
+
+    Returns None if *path* can't be stat'ed. The inode catches editors that
+    save by writing a new file and renaming it over the old one. An in-place
+    rewrite that keeps both the size and the mtime (possible within one
+    filesystem timestamp tick) is not detected; such an edit is picked up by
+    the next change to the file.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns, st.st_ino, stat.S_ISREG(st.st_mode))
+
+
+def _source_stamps(
+    sources: Sequence[_ConfigSource],
+) -> tuple[_Stamp | None, ...]:
+    """Stat each source, skipping those whose top-level entry is absent.
+
+    Each distinct root is listed once per call, so sources under
+    directories that don't exist (``.cursor``, ``.zed``, ...) cost no
+    syscalls of their own.
+    """
+    listings: dict[Path, frozenset[str]] = {}
+    stamps: list[_Stamp | None] = []
+    for source in sources:
+        if source.root is not None:
+            entries = listings.get(source.root)
+            if entries is None:
+                try:
+                    entries = frozenset(os.listdir(source.root))
+                except OSError:
+                    entries = frozenset()
+                listings[source.root] = entries
+            if source.path.relative_to(source.root).parts[0] not in entries:
+                stamps.append(None)
+                continue
+        stamps.append(_stat_stamp(source.path))
+    return tuple(stamps)
+
+
+def _read_servers(source: _ConfigSource) -> dict[str, dict[str, Any]]:
+    """Read *source* and extract its stdio servers."""
+    if source.fmt == "toml":
+        data = _read_toml(source.path)
+    else:
+        data = _read_json(source.path)
+    if data is None:
+        return {}
+    return _extract_stdio_servers(data, source.key)
+
+
+@functools.lru_cache(maxsize=64)
+def _servers_from(
+    source: _ConfigSource, stamp: _Stamp
+) -> dict[str, dict[str, Any]]:
+    """Like ``_read_servers``, cached per file on its ``_stat_stamp``.
+
+    A change to one config (or to the cwd) only re-parses the files that
+    actually differ. Only regular files may be cached: pipes, ``/dev/fd/N``
+    and procfs files keep the same stamp while their contents change.
+    """
+    return _read_servers(source)
+
+
 def discover_servers(
     config_paths: Sequence[str | Path] | None = None,
 ) -> dict[str, dict[str, Any]]:
@@ -191,26 +319,31 @@ def discover_servers(
         Dict mapping server name → config dict with ``command``, ``args``,
         and ``env`` keys.
     """
-    servers: dict[str, dict[str, Any]] = {}
-
     if config_paths is not None:
         # Explicit paths — all treated as JSON with "mcpServers" key
-        sources = [_ConfigSource(Path(p), "mcpServers") for p in config_paths]
+        sources = tuple(_ConfigSource(Path(p), "mcpServers") for p in config_paths)
     else:
         sources = _default_sources()
 
-    for source in sources:
-        if source.fmt == "toml":
-            data = _read_toml(source.path)
-        else:
-            data = _read_json(source.path)
-        if data is None:
+    servers: dict[str, dict[str, Any]] = {}
+    for source, stamp in zip(sources, _source_stamps(sources)):
+        # Missing or empty files can't contain servers; don't try to parse
+        # them. Pipes and /dev/fd/N always report a size of 0 and an
+        # unchanging stamp, so they are read every time and never cached.
+        if stamp is None:
             continue
+        size, _, _, is_regular = stamp
+        if not is_regular:
+            servers.update(_read_servers(source))
+        elif size:
+            servers.update(_servers_from(source, stamp))
 
-        found = _extract_stdio_servers(data, source.key)
-        servers.update(found)
-
-    return servers
+    # The entries are shared with the parse cache; give callers their own
+    # config dicts and args/env containers so they can't mutate it.
+    return {
+        name: {key: copy.copy(value) for key, value in config.items()}
+        for name, config in servers.items()
+    }
 
 
 def connect_servers(
@@ -234,27 +367,37 @@ def connect_servers(
 
     manager = _RustMCPManager()
     connected = 0
+    # Status lines go out in one write once every server has reported.
+    log: list[str] = []
 
+    requests = []
     for name, config in servers.items():
-        env = {k: _expand_env_vars(str(v)) for k, v in config.get("env", {}).items()}
-        try:
-            tool_count = manager.connect(
-                name,
-                config["command"],
-                config.get("args", []),
-                env,
-                connect_timeout,
-            )
+        command = config["command"]
+        args = config.get("args", [])
+        env = config.get("env")
+        # Malformed entries are rejected here: connect_all takes the batch as
+        # one typed list, so a single bad entry would otherwise fail them all.
+        if not isinstance(command, str):
+            error = "'command' must be a string"
+        elif not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+            error = "'args' must be a list of strings"
+        elif env is not None and not isinstance(env, dict):
+            error = "'env' must be a mapping"
+        else:
+            requests.append((name, command, args, _expand_env_dict(env)))
+            continue
+        log.append(f"MCP: failed to connect to '{name}': {error}")
+
+    # Connect concurrently; results come back in request order.
+    for name, result in manager.connect_all(requests, connect_timeout):
+        if isinstance(result, BaseException):
+            log.append(f"MCP: failed to connect to '{name}': {result}")
+        else:
             connected += 1
-            print(
-                f"MCP: connected to '{name}' ({tool_count} tools)",
-                file=sys.stderr,
-            )
-        except Exception as exc:
-            print(
-                f"MCP: failed to connect to '{name}': {exc}",
-                file=sys.stderr,
-            )
+            log.append(f"MCP: connected to '{name}' ({result} tools)")
+
+    if log:
+        print("\n".join(log), file=sys.stderr)
 
     if connected == 0:
         return None
@@ -14,61 +14,86 @@ Or as a one-liner via uv::
 from __future__ import annotations
 
 import argparse
+import io
 import sys
-import textwrap
+from collections.abc import Sequence
 
 import eryx
 
 from eryx._cli import add_sandbox_args, make_mcp_manager, make_net_config, make_resource_limits
 
 
-def _build_parser() -> argparse.ArgumentParser:
+_EPILOG = (
+    "examples:\n"
+    "  eryx serve                              basic sandbox server\n"
+    "  eryx serve --timeout 60000              60s execution timeout\n"
+    "  eryx serve --net                        with network access\n"
+    "  eryx serve --mcp                        with inner MCP tools\n"
+    "  eryx serve --mcp-config mcp.json        with explicit MCP config\n"
+)
+
+
+def _build_parser(argv: Sequence[str] | None = None) -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="eryx serve",
         description="Start an MCP server that exposes the eryx sandbox as a tool.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=textwrap.dedent("""\
-            examples:
-              eryx serve                              basic sandbox server
-              eryx serve --timeout 60000              60s execution timeout
-              eryx serve --net                        with network access
-              eryx serve --mcp                        with inner MCP tools
-              eryx serve --mcp-config mcp.json        with explicit MCP config
-        """),
+        epilog=_EPILOG,
     )
 
-    add_sandbox_args(parser)
+    add_sandbox_args(parser, argv)
 
     return parser
 
 
+_TOOL_DESCRIPTION = (
+    "Execute Python code in a persistent sandboxed environment. "
+    "State (variables, imports, functions) persists across calls. "
+    "Use `print()` to produce output."
+)
+
+
 def _build_tool_description(mcp_manager: object | None) -> str:
     """Build the run_python tool description, including available inner MCP tools."""
-    desc = (
-        "Execute Python code in a persistent sandboxed environment. "
-        "State (variables, imports, functions) persists across calls. "
-        "Use `print()` to produce output."
-    )
-
-    if mcp_manager is not None:
-        tools = mcp_manager.list_tools()  # type: ignore[union-attr]
-        if tools:
-            desc += "\n\nAvailable tools inside the sandbox (call with `await`):"
-            for t in tools:
-                name = t["name"]
-                tool_desc = t.get("description", "")
-                if tool_desc:
-                    if len(tool_desc) > 120:
-                        tool_desc = tool_desc[:117] + "..."
-                    desc += f"\n- `await {name}(...)`: {tool_desc}"
-                else:
-                    desc += f"\n- `await {name}(...)`"
-
-    return desc
+    if mcp_manager is None:
+        return _TOOL_DESCRIPTION
+    tools = mcp_manager.list_tools()  # type: ignore[union-attr]
+    if not tools:
+        return _TOOL_DESCRIPTION
+    lines = [
+        _TOOL_DESCRIPTION,
+        "",
+        "Available tools inside the sandbox (call with `await`):",
+    ]
+    for t in tools:
+        name = t["name"]
+        tool_desc = t.get("description", "")
+        if tool_desc:
+            if len(tool_desc) > 120:
+                tool_desc = tool_desc[:117] + "..."
+            lines.append(f"- `await {name}(...)`: {tool_desc}")
+        else:
+            lines.append(f"- `await {name}(...)`")
+    return "\n".join(lines)
+
+
+def _format_output(stdout: str, stderr: str, error: str | None = None) -> str:
+    """Combine captured output and an optional error into the tool result."""
+    if stderr:
+        out = f"{stdout}\n[stderr]\n{stderr}" if stdout else f"[stderr]\n{stderr}"
+    elif stdout:
+        # Common case: stdout alone is returned as-is, without copying.
+        out = stdout
+    else:
+        return "(no output)" if error is None else error
+    return out if error is None else f"{out}\n{error}"
 
 
 def serve(argv: list[str] | None = None) -> int:
     """Run the eryx MCP server over stdio."""
+    # Parse first so --help and bad flags exit without importing the mcp package.
+    args = _build_parser(argv).parse_args(argv)
+
     try:
         from mcp.server.fastmcp import FastMCP
     except ImportError:
@@ -80,8 +105,6 @@ def serve(argv: list[str] | None = None) -> int:
         )
         return 1
 
-    args = _build_parser().parse_args(argv)
-
     # Connect to inner MCP servers if requested
     mcp_manager = make_mcp_manager(args)
 
@@ -99,10 +122,10 @@ def serve(argv: list[str] | None = None) -> int:
         session_kwargs["mcp"] = mcp_manager
 
     # Mutable buffers for capturing output per-execution
-    stdout_chunks: list[str] = []
-    stderr_chunks: list[str] = []
-    session_kwargs["on_stdout"] = lambda chunk: stdout_chunks.append(chunk)
-    session_kwargs["on_stderr"] = lambda chunk: stderr_chunks.append(chunk)
+    stdout_buf = io.StringIO()
+    stderr_buf = io.StringIO()
+    session_kwargs["on_stdout"] = stdout_buf.write
+    session_kwargs["on_stderr"] = stderr_buf.write
 
     session = eryx.Session(**session_kwargs)
 
@@ -113,37 +136,25 @@ def serve(argv: list[str] | None = None) -> int:
     @server.tool(description=tool_description)
     def run_python(code: str, timeout_ms: int | None = None) -> str:
         """Execute Python code in the eryx sandbox."""
-        old_timeout = session.execution_timeout_ms
         if timeout_ms is not None:
+            old_timeout = session.execution_timeout_ms
             session.execution_timeout_ms = timeout_ms
 
-        stdout_chunks.clear()
-        stderr_chunks.clear()
+        for buf in (stdout_buf, stderr_buf):
+            buf.seek(0)
+            buf.truncate()
 
         try:
             session.execute(code)
-            stdout = "".join(stdout_chunks)
-            stderr = "".join(stderr_chunks)
-            parts = []
-            if stdout:
-                parts.append(stdout)
-            if stderr:
-                parts.append(f"[stderr]\n{stderr}")
-            return "\n".join(parts) if parts else "(no output)"
+            return _format_output(stdout_buf.getvalue(), stderr_buf.getvalue())
         except (
             eryx.ExecutionError,
             eryx.TimeoutError,
             eryx.ResourceLimitError,
         ) as exc:
-            stdout = "".join(stdout_chunks)
-            stderr = "".join(stderr_chunks)
-            parts = []
-            if stdout:
-                parts.append(stdout)
-            if stderr:
-                parts.append(f"[stderr]\n{stderr}")
-            parts.append(str(exc))
-            return "\n".join(parts)
+            return _format_output(
+                stdout_buf.getvalue(), stderr_buf.getvalue(), str(exc)
+            )
         finally:
             if timeout_ms is not None:
                 session.execution_timeout_ms = old_timeout
@@ -72,6 +72,53 @@ pub struct MCPManager {
 unsafe impl Send for MCPManager {}
 unsafe impl Sync for MCPManager {}
 
+/// Spawn an MCP server process, perform the handshake and fetch its tools.
+async fn open_connection(
+    name: String,
+    command: String,
+    args: Vec<String>,
+    env: HashMap<String, String>,
+    timeout_secs: f64,
+) -> PyResult<MCPConnection> {
+    let timeout = std::time::Duration::from_secs_f64(timeout_secs);
+
+    // Build the child process command
+    let mut cmd = tokio::process::Command::new(&command);
+    cmd.args(&args);
+    for (k, v) in &env {
+        cmd.env(k, v);
+    }
+
+    let transport = TokioChildProcess::new(cmd).map_err(|e| {
+        InitializationError::new_err(format!(
+            "failed to spawn MCP server '{name}' ({command}): {e}"
+        ))
+    })?;
+
+    // Connect and perform the MCP handshake
+    let service = tokio::time::timeout(timeout, ().serve(transport))
+        .await
+        .map_err(|_| {
+            InitializationError::new_err(format!(
+                "MCP server '{name}' connection timed out after {timeout_secs}s"
+            ))
+        })?
+        .map_err(|e| {
+            InitializationError::new_err(format!("MCP handshake failed for '{name}': {e}"))
+        })?;
+
+    // List available tools
+    let tools_resp = service.list_tools(Default::default()).await.map_err(|e| {
+        InitializationError::new_err(format!("failed to list tools from '{name}': {e}"))
+    })?;
+
+    Ok(MCPConnection {
+        name,
+        service,
+        tools: tools_resp.tools,
+    })
+}
+
 #[pymethods]
 impl MCPManager {
     /// Create a new empty MCP manager.
@@ -116,53 +163,80 @@ impl MCPManager {
         timeout_secs: f64,
     ) -> PyResult<usize> {
         let runtime = self.runtime.clone();
-        let timeout = std::time::Duration::from_secs_f64(timeout_secs);
 
-        py.detach(|| {
-            runtime.block_on(async {
-                // Build the child process command
-                let mut cmd = tokio::process::Command::new(&command);
-                cmd.args(&args);
-                for (k, v) in &env {
-                    cmd.env(k, v);
-                }
-
-                let transport = TokioChildProcess::new(cmd).map_err(|e| {
-                    InitializationError::new_err(format!(
-                        "failed to spawn MCP server '{name}' ({command}): {e}"
-                    ))
-                })?;
-
-                // Connect and perform the MCP handshake
-                let service = tokio::time::timeout(timeout, ().serve(transport))
-                    .await
-                    .map_err(|_| {
-                        InitializationError::new_err(format!(
-                            "MCP server '{name}' connection timed out after {timeout_secs}s"
-                        ))
-                    })?
-                    .map_err(|e| {
-                        InitializationError::new_err(format!(
-                            "MCP handshake failed for '{name}': {e}"
-                        ))
-                    })?;
-
-                // List available tools
-                let tools_resp = service.list_tools(Default::default()).await.map_err(|e| {
-                    InitializationError::new_err(format!("failed to list tools from '{name}': {e}"))
-                })?;
-
-                let tool_count = tools_resp.tools.len();
+        let conn = py
+            .detach(|| runtime.block_on(open_connection(name, command, args, env, timeout_secs)))?;
+        let tool_count = conn.tools.len();
+        self.connections.push(conn);
+        Ok(tool_count)
+    }
 
-                self.connections.push(MCPConnection {
-                    name,
-                    service,
-                    tools: tools_resp.tools,
-                });
+    /// Connect to several MCP servers concurrently.
+    ///
+    /// Each server is spawned and handshaken in parallel, so the total time
+    /// is roughly that of the slowest server rather than the sum. Servers
+    /// that connect are added in the order given, as if `connect` had been
+    /// called for each in turn.
+    ///
+    /// Args:
+    ///     servers: A list of `(name, command, args, env)` tuples.
+    ///     timeout_secs: Timeout in seconds for each connection handshake.
+    ///
+    /// Returns:
+    ///     A list of `(name, result)` pairs in the same order as `servers`,
+    ///     where `result` is the server's tool count on success or the
+    ///     `InitializationError` describing why it failed.
+    #[pyo3(signature = (servers, timeout_secs=30.0))]
+    fn connect_all(
+        &mut self,
+        py: Python<'_>,
+        servers: Vec<(String, String, Vec<String>, HashMap<String, String>)>,
+        timeout_secs: f64,
+    ) -> PyResult<Vec<(String, Py<PyAny>)>> {
+        let runtime = self.runtime.clone();
 
-                Ok(tool_count)
+        let outcomes = py.detach(|| {
+            runtime.block_on(async {
+                let handles: Vec<_> = servers
+                    .into_iter()
+                    .map(|(name, command, args, env)| {
+                        let task = runtime.spawn(open_connection(
+                            name.clone(),
+                            command,
+                            args,
+                            env,
+                            timeout_secs,
+                        ));
+                        (name, task)
+                    })
+                    .collect();
+
+                let mut outcomes = Vec::with_capacity(handles.len());
+                for (name, task) in handles {
+                    let outcome = task.await.unwrap_or_else(|e| {
+                        Err(InitializationError::new_err(format!(
+                            "MCP connection task for '{name}' failed: {e}"
+                        )))
+                    });
+                    outcomes.push((name, outcome));
+                }
+                outcomes
             })
-        })
+        });
+
+        let mut results = Vec::with_capacity(outcomes.len());
+        for (name, outcome) in outcomes {
+            let result = match outcome {
+                Ok(conn) => {
+                    let tool_count = conn.tools.len().into_pyobject(py)?.into_any().unbind();
+                    self.connections.push(conn);
+                    tool_count
+                }
+                Err(e) => e.into_value(py).into_any(),
+            };
+            results.push((name, result));
+        }
+        Ok(results)
     }
 
     /// Get the names of all connected MCP servers.
@@ -2,7 +2,7 @@
 //!
 //! Provides the main `Sandbox` class that Python users interact with.
 
-use std::sync::Arc;
+use std::sync::{Arc, Mutex, PoisonError};
 
 use async_trait::async_trait;
 use pyo3::prelude::*;
@@ -16,6 +16,48 @@ use crate::net_config::NetConfig;
 use crate::resource_limits::ResourceLimits;
 use crate::result::ExecuteResult;
 
+/// Get the process-wide tokio runtime shared by sandboxes and sessions.
+///
+/// The wasmtime `Engine` is already process-wide; building a multi-threaded
+/// runtime per `Sandbox`/`Session` spawned (and later joined) a full set of
+/// worker threads on every construction.
+///
+/// The runtime is tagged with the pid that built it. A child forked from a
+/// process that already had one (`multiprocessing`'s fork start method,
+/// gunicorn `--preload`) inherits the runtime but none of its worker threads,
+/// so the child builds a fresh runtime on first use instead. Sandboxes and
+/// sessions created before the fork keep the parent's runtime and can't be
+/// used in the child.
+///
+/// # Errors
+///
+/// Returns an error if the runtime cannot be created.
+pub(crate) fn shared_runtime() -> PyResult<Arc<tokio::runtime::Runtime>> {
+    static SHARED_RUNTIME: Mutex<Option<(u32, Arc<tokio::runtime::Runtime>)>> = Mutex::new(None);
+
+    let pid = std::process::id();
+    let mut shared = SHARED_RUNTIME
+        .lock()
+        .unwrap_or_else(PoisonError::into_inner);
+    if let Some((owner, runtime)) = shared.as_ref()
+        && *owner == pid
+    {
+        return Ok(Arc::clone(runtime));
+    }
+
+    let runtime = tokio::runtime::Builder::new_multi_thread()
+        .enable_all()
+        .build()
+        .map_err(|e| InitializationError::new_err(format!("failed to create runtime: {e}")))?;
+    let runtime = Arc::new(runtime);
+    if let Some((_, inherited)) = shared.replace((pid, Arc::clone(&runtime))) {
+        // Dropping the parent's runtime would try to shut down and join worker
+        // threads that don't exist in this process.
+        std::mem::forget(inherited);
+    }
+    Ok(runtime)
+}
+
 /// An `OutputHandler` backed by Python callables for stdout and stderr.
 pub(crate) struct PyOutputHandler {
     pub(crate) on_stdout: Option<Py<PyAny>>,
@@ -72,7 +114,7 @@ pub struct Sandbox {
     /// The underlying eryx Sandbox.
     inner: eryx::Sandbox,
     /// Tokio runtime for executing async code.
-    /// We use Arc<Runtime> to allow sharing with SandboxFactory.
+    /// Shared process-wide; see [`shared_runtime`].
     runtime: Arc<tokio::runtime::Runtime>,
 }
 
@@ -157,15 +199,7 @@ impl Sandbox {
         on_stderr: Option<Py<PyAny>>,
         result_variable: Option<String>,
     ) -> PyResult<Self> {
-        // Create a tokio runtime for async execution
-        let runtime = Arc::new(
-            tokio::runtime::Builder::new_multi_thread()
-                .enable_all()
-                .build()
-                .map_err(|e| {
-                    InitializationError::new_err(format!("failed to create runtime: {e}"))
-                })?,
-        );
+        let runtime = shared_runtime()?;
 
         // Build the eryx sandbox with embedded runtime
         let mut builder = eryx::Sandbox::embedded();
@@ -298,14 +332,7 @@ impl Sandbox {
     ///
     /// Returns an error if the tokio runtime cannot be created.
     pub(crate) fn from_inner(inner: eryx::Sandbox) -> PyResult<Self> {
-        let runtime = Arc::new(
-            tokio::runtime::Builder::new_multi_thread()
-                .enable_all()
-                .build()
-                .map_err(|e| {
-                    InitializationError::new_err(format!("failed to create runtime: {e}"))
-                })?,
-        );
+        let runtime = shared_runtime()?;
         Ok(Self { inner, runtime })
     }
 }
@@ -17,7 +17,7 @@ use crate::callback::extract_callbacks;
 use crate::error::{InitializationError, eryx_error_to_py};
 use crate::net_config::NetConfig;
 use crate::result::ExecuteResult;
-use crate::sandbox::PyOutputHandler;
+use crate::sandbox::{PyOutputHandler, shared_runtime};
 use crate::vfs::VfsStorage;
 
 /// A session that maintains persistent Python state across executions.
@@ -128,18 +128,13 @@ impl Session {
         on_stderr: Option<Py<PyAny>>,
         result_variable: Option<String>,
     ) -> PyResult<Self> {
-        // Create a tokio runtime for async execution
-        let runtime = Arc::new(
-            tokio::runtime::Builder::new_multi_thread()
-                .enable_all()
-                .build()
-                .map_err(|e| {
-                    InitializationError::new_err(format!("failed to create runtime: {e}"))
-                })?,
-        );
-
-        // Create the PythonExecutor from embedded runtime
-        let mut executor = eryx::PythonExecutor::from_embedded_runtime()
+        let runtime = shared_runtime()?;
+
+        // Create the PythonExecutor from embedded runtime. Loading the runtime
+        // is the slow part of session creation, so release the GIL while it
+        // runs to let callers build a session on a background thread.
+        let mut executor = py
+            .detach(eryx::PythonExecutor::from_embedded_runtime)
             .map_err(|e| InitializationError::new_err(format!("failed to create executor: {e}")))?;
         if let Some(name) = result_variable {
             executor = executor.with_result_variable(name);
@@ -191,38 +186,41 @@ impl Session {
         let mount_path = vfs_mount_path.clone();
         let needs_vfs = vfs_storage.is_some() || !volume_mounts.is_empty();
 
-        let (inner, vfs_storage) = runtime
-            .block_on(async {
-                if needs_vfs {
-                    // Auto-create VFS storage if volumes are requested but no VFS provided
-                    let storage: eryx::vfs::ArcStorage = if let Some(s) = vfs_storage {
-                        s
-                    } else {
-                        eryx::vfs::ArcStorage::new(Arc::new(eryx::vfs::ScrubbingStorage::new(
-                            eryx::vfs::InMemoryStorage::new(),
-                            std::collections::HashMap::new(),
-                            eryx::vfs::VfsFileScrubPolicy::None,
-                        )))
-                    };
-                    let mut config = if let Some(path) = &mount_path {
-                        eryx::VfsConfig::new(path)
+        let (inner, vfs_storage) = py
+            .detach(|| {
+                runtime.block_on(async {
+                    if needs_vfs {
+                        // Auto-create VFS storage if volumes are requested but no VFS provided
+                        let storage: eryx::vfs::ArcStorage = if let Some(s) = vfs_storage {
+                            s
+                        } else {
+                            eryx::vfs::ArcStorage::new(Arc::new(eryx::vfs::ScrubbingStorage::new(
+                                eryx::vfs::InMemoryStorage::new(),
+                                std::collections::HashMap::new(),
+                                eryx::vfs::VfsFileScrubPolicy::None,
+                            )))
+                        };
+                        let mut config = if let Some(path) = &mount_path {
+                            eryx::VfsConfig::new(path)
+                        } else {
+                            eryx::VfsConfig::default()
+                        };
+                        config.volumes = volume_mounts;
+                        let session = eryx::SessionExecutor::new_with_vfs_config(
+                            Arc::clone(&executor),
+                            &callbacks_vec,
+                            storage.clone(),
+                            config,
+                        )
+                        .await?;
+                        Ok((session, Some(storage)))
                     } else {
-                        eryx::VfsConfig::default()
-                    };
-                    config.volumes = volume_mounts;
-                    let session = eryx::SessionExecutor::new_with_vfs_config(
-                        Arc::clone(&executor),
-                        &callbacks_vec,
-                        storage.clone(),
-                        config,
-                    )
-                    .await?;
-                    Ok((session, Some(storage)))
-                } else {
-                    let session =
-                        eryx::SessionExecutor::new(Arc::clone(&executor), &callbacks_vec).await?;
-                    Ok((session, None))
-                }
+                        let session =
+                            eryx::SessionExecutor::new(Arc::clone(&executor), &callbacks_vec)
+                                .await?;
+                        Ok((session, None))
+                    }
+                })
             })
             .map_err(eryx_error_to_py)?;
 
@@ -2,8 +2,8 @@
 
 import ipaddress
 import os
-import socket
 import ssl
+import sys
 import tempfile
 import threading
 from http.server import HTTPServer, SimpleHTTPRequestHandler
@@ -58,13 +58,6 @@ class QuietHTTPHandler(SimpleHTTPRequestHandler):
         self._send_response(200, "application/json", response.encode())
 
 
-def _find_free_port():
-    """Find a free port on localhost."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
-
-
 def _generate_self_signed_cert(cert_path: Path, key_path: Path):
     """Generate a self-signed certificate for testing."""
     import datetime
@@ -130,8 +123,9 @@ def http_server():
 
     Returns a tuple of (host, port).
     """
-    port = _find_free_port()
-    server = HTTPServer(("127.0.0.1", port), QuietHTTPHandler)
+    # Bind port 0 so the kernel picks a free port atomically.
+    server = HTTPServer(("127.0.0.1", 0), QuietHTTPHandler)
+    port = server.server_port
 
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
@@ -156,8 +150,8 @@ def https_server(tmp_path_factory):
 
     cert_der = _generate_self_signed_cert(cert_path, key_path)
 
-    port = _find_free_port()
-    server = HTTPServer(("127.0.0.1", port), QuietHTTPHandler)
+    server = HTTPServer(("127.0.0.1", 0), QuietHTTPHandler)
+    port = server.server_port
 
     # Wrap with SSL
     context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
@@ -183,6 +177,24 @@ def sandbox():
     return eryx.Sandbox()
 
 
+@pytest.fixture(scope="session")
+def default_sandbox():
+    """A default-configured sandbox shared across tests.
+
+    Each ``execute()`` call runs in isolation, so tests that only need the
+    default configuration can share one instance instead of paying sandbox
+    startup every time.
+    """
+    return eryx.Sandbox()
+
+
+@pytest.fixture(scope="session")
+def timeout_sandbox():
+    """A sandbox with a 500ms execution timeout, shared across tests."""
+    limits = eryx.ResourceLimits(execution_timeout_ms=500)
+    return eryx.Sandbox(resource_limits=limits)
+
+
 @pytest.fixture
 def network_sandbox(http_server):
     """Create a sandbox with permissive network config that allows localhost.
@@ -224,6 +236,29 @@ def sandbox_factory():
     return _shared_factory
 
 
+# =============================================================================
+# MCP Fixtures
+# =============================================================================
+
+
+MOCK_MCP_SERVER = str(Path(__file__).parent / "mock_mcp_server.py")
+
+
+@pytest.fixture(scope="session")
+def mcp_manager():
+    """An MCPManager connected to the mock MCP server as ``mock``.
+
+    The mock server is stateless, so one connection is shared across tests
+    instead of spawning and handshaking a new subprocess for each. Tests
+    that connect, close or otherwise change a manager should create their
+    own.
+    """
+    manager = eryx.MCPManager()
+    manager.connect("mock", sys.executable, [MOCK_MCP_SERVER], {}, 10.0)
+    yield manager
+    manager.close()
+
+
 # =============================================================================
 # Wheel Fixtures
 # =============================================================================
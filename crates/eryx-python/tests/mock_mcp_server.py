@@ -118,20 +118,24 @@ def _handle_request(msg: dict) -> dict | None:
 
 def main() -> None:
     """Run the mock MCP server using newline-delimited JSON on stdio."""
-    for line in sys.stdin:
+    # Binary streams: json accepts bytes, so skip the text layer both ways.
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    for line in stdin:
         line = line.strip()
         if not line:
             continue
 
         try:
             msg = json.loads(line)
-        except json.JSONDecodeError:
+        except ValueError:
             continue
 
         response = _handle_request(msg)
         if response is not None:
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
+            # The client waits for each response, so flush every message.
+            stdout.write(json.dumps(response).encode() + b"\n")
+            stdout.flush()
 
 
 if __name__ == "__main__":
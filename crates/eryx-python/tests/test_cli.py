@@ -1,13 +1,16 @@
 """Tests for the eryx CLI (__main__.py)."""
 
+import io
 import subprocess
 import sys
 import textwrap
 from unittest.mock import patch
 
+import eryx
 import pytest
 
-from eryx.__main__ import main
+from eryx.__main__ import _CliArgs, _build_parser, _fast_parse, main
+from eryx._cli import SandboxArgs, make_net_config, make_resource_limits
 
 
 class TestCliCommandExecution:
@@ -70,7 +73,7 @@ class TestCliScriptExecution:
 
     def test_execute_stdin_dash(self, capsys):
         with patch("sys.stdin") as mock_stdin:
-            mock_stdin.read.return_value = 'print("from stdin")'
+            mock_stdin.buffer.read.return_value = b'print("from stdin")'
             result = main(["-"])
             assert result == 0
             captured = capsys.readouterr()
@@ -111,6 +114,26 @@ class TestCliNetworking:
         assert "ok" in captured.out
 
 
+class TestCliConfigBuilders:
+    """The ResourceLimits/NetConfig builders must not share instances."""
+
+    def test_resource_limits_are_fresh(self):
+        args = SandboxArgs(timeout=1000)
+        first = make_resource_limits(args)
+        first.execution_timeout_ms = 5
+        second = make_resource_limits(args)
+        assert second is not first
+        assert second.execution_timeout_ms == 1000
+
+    def test_net_config_is_fresh(self):
+        args = SandboxArgs(net=True, allow_host=("api.example.com",))
+        first = make_net_config(args)
+        first.allow_host("*.attacker.com")
+        second = make_net_config(args)
+        assert "api.example.com" in second.allowed_hosts
+        assert "*.attacker.com" not in second.allowed_hosts
+
+
 class TestCliVolume:
     """Tests for volume mount flag."""
 
@@ -186,14 +209,184 @@ class TestCliMutualExclusion:
         assert exc_info.value.code != 0
 
 
+class TestCliLazyOptionGroups:
+    """Option groups are only built when argv can mention them."""
+
+    @staticmethod
+    def _parse(argv):
+        lazy = _build_parser(argv).parse_args(argv)
+        full = _build_parser().parse_args(argv)
+        assert vars(lazy) == vars(full)
+        return lazy
+
+    @pytest.mark.parametrize(
+        ("argv", "dest", "expected"),
+        [
+            (["--vol", "/a:/b"], "volume", [("/a", "/b", False)]),
+            (["--time", "5"], "timeout", 5),
+            (["--max", "10"], "max_memory", 10),
+            (["--allow", "*.example.com"], "allow_host", ["*.example.com"]),
+            (["--mcp-c", "cfg.json"], "mcp_config", ["cfg.json"]),
+        ],
+    )
+    def test_abbreviated_long_options(self, argv, dest, expected):
+        ns = self._parse([*argv, "-c", "pass"])
+        assert getattr(ns, dest) == expected
+
+    def test_long_option_equals_value(self):
+        ns = self._parse(
+            [
+                "--timeout=5000",
+                "--allow-host=*.example.com",
+                "--mcp-config=cfg.json",
+                "--volume=/a:/b:ro",
+                "-c",
+                "pass",
+            ]
+        )
+        assert ns.timeout == 5000
+        assert ns.allow_host == ["*.example.com"]
+        assert ns.mcp_config == ["cfg.json"]
+        assert ns.volume == [("/a", "/b", True)]
+
+    def test_attached_short_option(self):
+        ns = self._parse(["-v/a:/b", "-c", "pass"])
+        assert ns.volume == [("/a", "/b", False)]
+
+    def test_no_sandbox_options(self):
+        ns = self._parse(["-c", "pass"])
+        assert ns.command == "pass"
+        assert ns.volume == []
+
+    @pytest.mark.parametrize("flag", ["-h", "--help", "--he"])
+    def test_help_lists_every_group(self, flag, capsys):
+        with pytest.raises(SystemExit) as exc_info:
+            main([flag])
+        assert exc_info.value.code == 0
+        out = capsys.readouterr().out
+        for group in ("resource limits", "networking", "MCP", "filesystem"):
+            assert group in out
+        for option in ("--timeout", "--allow-host", "--mcp-config", "--volume"):
+            assert option in out
+
+
+class TestCliFastParse:
+    """The argparse-free fast path must agree with the full parser."""
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["-c", 'print("hi")'],
+            ["-c", ""],
+            ["-c", " -x"],
+            ["-"],
+            ["script.py"],
+        ],
+    )
+    def test_matches_full_parser(self, argv):
+        fast = _fast_parse(argv)
+        assert fast is not None
+        assert fast == _CliArgs.from_namespace(_build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["-c", "-1"],
+            ["-c", "pass", "--net"],
+            ["--", "script.py"],
+        ],
+    )
+    def test_defers_to_full_parser(self, argv):
+        assert _fast_parse(argv) is None
+        lazy = _build_parser(argv).parse_args(argv)
+        assert vars(lazy) == vars(_build_parser().parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["-c"],
+            ["-c", "--net"],
+            ["-c", "-v"],
+            ["-c", "print(1)", "extra"],
+            ["script.py", "extra"],
+            ["-", "extra"],
+            ["--bogus"],
+        ],
+    )
+    def test_errors_match_full_parser(self, argv, capsys):
+        assert _fast_parse(argv) is None
+        with pytest.raises(SystemExit) as full_exit:
+            _build_parser().parse_args(argv)
+        full_error = capsys.readouterr().err.splitlines()[-1]
+        with pytest.raises(SystemExit) as main_exit:
+            main(argv)
+        assert main_exit.value.code == full_exit.value.code == 2
+        # The usage line may differ, since only the mentioned groups are built.
+        assert capsys.readouterr().err.splitlines()[-1] == full_error
+
+
 class TestCliPipedInput:
     """Tests for piped stdin behavior."""
 
     def test_piped_stdin_without_dash(self, capsys):
         with patch("sys.stdin") as mock_stdin:
             mock_stdin.isatty.return_value = False
-            mock_stdin.read.return_value = 'print("piped")'
+            mock_stdin.buffer.read.return_value = b'print("piped")'
             result = main([])
             assert result == 0
             captured = capsys.readouterr()
             assert "piped" in captured.out
+
+
+class TestCliRepl:
+    """Tests for the interactive REPL."""
+
+    def _run_repl(self, lines):
+        with (
+            patch("sys.stdin") as mock_stdin,
+            patch("builtins.input", side_effect=[*lines, EOFError]),
+        ):
+            mock_stdin.isatty.return_value = True
+            return main([])
+
+    def test_repl_executes_lines(self, capsys):
+        assert self._run_repl(["x = 21", "print(x * 2)"]) == 0
+        assert "42" in capsys.readouterr().out
+
+    def test_repl_output_follows_stdout_redirection(self, monkeypatch):
+        """Output goes to whatever sys.stdout is when it is produced."""
+        # Start from a line-buffered stream, like a terminal.
+        terminal = io.TextIOWrapper(io.BytesIO(), line_buffering=True)
+        monkeypatch.setattr(sys, "stdout", terminal)
+        outputs = [io.StringIO(), io.StringIO()]
+        lines = ["print('first')", "print('second')"]
+
+        def fake_input(prompt):
+            if not lines:
+                raise EOFError
+            monkeypatch.setattr(sys, "stdout", outputs[2 - len(lines)])
+            return lines.pop(0)
+
+        with patch("sys.stdin") as mock_stdin, patch("builtins.input", fake_input):
+            mock_stdin.isatty.return_value = True
+            assert main([]) == 0
+        assert outputs[0].getvalue() == "first\n"
+        assert outputs[1].getvalue().startswith("second\n")
+
+    def test_repl_session_error_reported(self, capsys):
+        error = eryx.InitializationError("bad volume")
+        with patch("eryx.Session", side_effect=error):
+            result = self._run_repl(["print(1)"])
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "InitializationError: bad volume" in captured.err
+        assert captured.err.count("bad volume") == 1
+        assert "Traceback" not in captured.err
+
+    def test_repl_session_error_reported_on_exit(self, capsys):
+        error = eryx.InitializationError("bad volume")
+        with patch("eryx.Session", side_effect=error):
+            result = self._run_repl([])
+        assert result == 1
+        assert capsys.readouterr().err.count("bad volume") == 1
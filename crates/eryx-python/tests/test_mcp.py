@@ -6,6 +6,7 @@ import json
 import os
 import sys
 import textwrap
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
@@ -165,6 +166,71 @@ class TestConfigDiscovery:
         assert "no_cmd" not in servers
         assert "has_cmd" in servers
 
+    @pytest.mark.skipif(
+        not os.path.isdir("/dev/fd"), reason="requires /dev/fd (e.g. <(cat cfg))"
+    )
+    def test_discover_from_pipe(self):
+        """Test reading a config from a pipe, which always stats as empty."""
+        from eryx.mcp import discover_servers
+
+        config = {"mcpServers": {"test": {"command": "cmd1"}}}
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, json.dumps(config).encode())
+            os.close(write_fd)
+            servers = discover_servers(config_paths=[f"/dev/fd/{read_fd}"])
+        finally:
+            os.close(read_fd)
+        assert servers["test"]["command"] == "cmd1"
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires os.mkfifo")
+    def test_discover_rereads_fifo(self, tmp_path):
+        """Test that a FIFO config is read afresh each time, never cached."""
+        from eryx.mcp import discover_servers
+
+        fifo = tmp_path / "mcp.fifo"
+        os.mkfifo(fifo)
+        for name in ("a", "b"):
+            config = {"mcpServers": {name: {"command": "cmd"}}}
+            writer = threading.Thread(
+                target=fifo.write_text, args=(json.dumps(config),)
+            )
+            writer.start()
+            servers = discover_servers(config_paths=[fifo])
+            writer.join()
+            assert list(servers) == [name]
+
+    def test_discover_rereads_changed_config(self, tmp_path):
+        """Test that cached discovery picks up edits to a config file."""
+        from eryx.mcp import discover_servers
+
+        config_file = tmp_path / ".mcp.json"
+        config_file.write_text(json.dumps({"mcpServers": {"a": {"command": "cmd1"}}}))
+        servers = discover_servers(config_paths=[config_file])
+        assert servers["a"]["command"] == "cmd1"
+
+        # Rewritten in place with a different size, so the edit is seen even
+        # if the mtime doesn't move. A same-size rewrite within one mtime
+        # tick is not detected (see _stat_stamp).
+        config_file.write_text(json.dumps({"mcpServers": {"b2": {"command": "cmd2"}}}))
+
+        servers = discover_servers(config_paths=[config_file])
+        assert "a" not in servers
+        assert servers["b2"]["command"] == "cmd2"
+
+    def test_discover_result_is_not_shared(self, tmp_path):
+        """Test that mutating a discovery result doesn't affect later calls."""
+        from eryx.mcp import discover_servers
+
+        config_file = tmp_path / ".mcp.json"
+        config_file.write_text(
+            json.dumps({"mcpServers": {"test": {"command": "cmd1", "args": ["x"]}}})
+        )
+
+        discover_servers(config_paths=[config_file])["test"]["args"].append("y")
+        servers = discover_servers(config_paths=[config_file])
+        assert servers["test"]["args"] == ["x"]
+
 
 class TestMultiIDEDiscovery:
     """Tests for discovering MCP servers from various IDE config formats."""
@@ -338,14 +404,12 @@ class TestEnvVarExpansion:
         with patch.dict(os.environ, {"MY_VAR": "hello"}):
             assert _expand_env_vars("${MY_VAR}") == "hello"
 
-    def test_expand_with_default(self):
+    def test_expand_with_default(self, monkeypatch):
         from eryx.mcp import _expand_env_vars
 
         # Unset variable uses default
-        env = os.environ.copy()
-        env.pop("UNSET_VAR", None)
-        with patch.dict(os.environ, env, clear=True):
-            assert _expand_env_vars("${UNSET_VAR:-fallback}") == "fallback"
+        monkeypatch.delenv("UNSET_VAR", raising=False)
+        assert _expand_env_vars("${UNSET_VAR:-fallback}") == "fallback"
 
     def test_expand_set_var_ignores_default(self):
         from eryx.mcp import _expand_env_vars
@@ -353,13 +417,11 @@ class TestEnvVarExpansion:
         with patch.dict(os.environ, {"SET_VAR": "real_value"}):
             assert _expand_env_vars("${SET_VAR:-fallback}") == "real_value"
 
-    def test_expand_missing_var_empty(self):
+    def test_expand_missing_var_empty(self, monkeypatch):
         from eryx.mcp import _expand_env_vars
 
-        env = os.environ.copy()
-        env.pop("MISSING", None)
-        with patch.dict(os.environ, env, clear=True):
-            assert _expand_env_vars("$MISSING") == ""
+        monkeypatch.delenv("MISSING", raising=False)
+        assert _expand_env_vars("$MISSING") == ""
 
     def test_expand_in_url(self):
         from eryx.mcp import _expand_env_vars
@@ -433,6 +495,28 @@ class TestMCPManager:
 
         manager.close()
 
+    def test_connect_all(self):
+        """Test connecting to several servers at once, with one failure."""
+        manager = eryx.MCPManager()
+        results = manager.connect_all(
+            [
+                ("server1", sys.executable, [MOCK_SERVER], {}),
+                ("bad", "/nonexistent/command", [], {}),
+                ("server2", sys.executable, [MOCK_SERVER], {}),
+            ],
+            10.0,
+        )
+
+        assert [name for name, _ in results] == ["server1", "bad", "server2"]
+        assert results[0][1] == 2
+        assert isinstance(results[1][1], eryx.InitializationError)
+        assert results[2][1] == 2
+
+        assert manager.server_names == ["server1", "server2"]
+        assert len(manager.list_tools()) == 4
+
+        manager.close()
+
     def test_close_idempotent(self):
         """Test that close() can be called multiple times safely."""
         manager = eryx.MCPManager()
@@ -449,33 +533,24 @@ class TestMCPManager:
         assert "tools=2" in r
         manager.close()
 
-    def test_tool_descriptions(self):
+    def test_tool_descriptions(self, mcp_manager):
         """Test that tool descriptions are populated."""
-        manager = eryx.MCPManager()
-        manager.connect("mock", sys.executable, [MOCK_SERVER], {}, 10.0)
+        tools = {t["name"]: t for t in mcp_manager.list_tools()}
 
-        tools = manager.list_tools()
-        echo_tool = next(t for t in tools if t["name"] == 'mcp["mock"].echo')
+        echo_tool = tools['mcp["mock"].echo']
         assert "echo" in echo_tool["description"].lower()
 
-        add_tool = next(t for t in tools if t["name"] == 'mcp["mock"].add')
+        add_tool = tools['mcp["mock"].add']
         assert "add" in add_tool["description"].lower()
 
-        manager.close()
-
-    def test_tool_schemas(self):
+    def test_tool_schemas(self, mcp_manager):
         """Test that tool schemas are populated."""
-        manager = eryx.MCPManager()
-        manager.connect("mock", sys.executable, [MOCK_SERVER], {}, 10.0)
+        tools = {t["name"]: t for t in mcp_manager.list_tools()}
 
-        tools = manager.list_tools()
-        echo_tool = next(t for t in tools if t["name"] == 'mcp["mock"].echo')
-        schema = echo_tool["schema"]
+        schema = tools['mcp["mock"].echo']["schema"]
         assert "properties" in schema
         assert "message" in schema["properties"]
 
-        manager.close()
-
 
 # =============================================================================
 # Sandbox Integration Tests
@@ -483,15 +558,10 @@ class TestMCPManager:
 
 
 class TestMCPSandboxIntegration:
-    """Tests for MCP tools used via Sandbox."""
+    """Tests for MCP tools used via Sandbox.
 
-    @pytest.fixture
-    def mcp_manager(self):
-        """Create an MCPManager connected to the mock server."""
-        manager = eryx.MCPManager()
-        manager.connect("mock", sys.executable, [MOCK_SERVER], {}, 10.0)
-        yield manager
-        manager.close()
+    Uses the session-scoped ``mcp_manager`` fixture from conftest.py.
+    """
 
     def test_echo_tool(self, mcp_manager):
         """Test calling the echo MCP tool from sandbox."""
@@ -601,15 +671,10 @@ class TestMCPSandboxIntegration:
 
 
 class TestMCPSessionIntegration:
-    """Tests for MCP tools used via Session."""
+    """Tests for MCP tools used via Session.
 
-    @pytest.fixture
-    def mcp_manager(self):
-        """Create an MCPManager connected to the mock server."""
-        manager = eryx.MCPManager()
-        manager.connect("mock", sys.executable, [MOCK_SERVER], {}, 10.0)
-        yield manager
-        manager.close()
+    Uses the session-scoped ``mcp_manager`` fixture from conftest.py.
+    """
 
     def test_session_mcp_tool(self, mcp_manager):
         """Test calling MCP tool from a Session."""
@@ -667,7 +732,7 @@ class TestMCPSessionIntegration:
 class TestMCPCLI:
     """Tests for MCP CLI flags."""
 
-    def test_mcp_config_flag(self, tmp_path):
+    def test_mcp_config_flag(self, tmp_path, capsys):
         """Test --mcp-config flag with the mock server."""
         config = {
             "mcpServers": {
@@ -683,20 +748,8 @@ class TestMCPCLI:
         from eryx.__main__ import main
 
         code = 'r = await mcp.mock.echo(message="cli-test"); print(r["text"])'
-        # Capture stdout
-        import io
-
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        sys.stdout = io.StringIO()
-        sys.stderr = io.StringIO()
-        try:
-            exit_code = main(["-c", code, "--mcp-config", str(config_file)])
-            stdout_val = sys.stdout.getvalue()
-            stderr_val = sys.stderr.getvalue()
-        finally:
-            sys.stdout = old_stdout
-            sys.stderr = old_stderr
+        exit_code = main(["-c", code, "--mcp-config", str(config_file)])
+        captured = capsys.readouterr()
 
-        assert exit_code == 0, f"exit_code={exit_code}, stderr={stderr_val}"
-        assert "cli-test" in stdout_val
+        assert exit_code == 0, f"exit_code={exit_code}, stderr={captured.err}"
+        assert "cli-test" in captured.out
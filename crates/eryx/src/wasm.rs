@@ -41,6 +41,33 @@ use crate::callback::Callback;
 use crate::error::Error;
 use crate::trace::TraceEvent;
 
+/// Comment line appended to the code passed to the guest's `execute` export when
+/// nothing consumes trace events.
+///
+/// The guest strips it and skips installing its per-line `sys.settrace` hook;
+/// runtimes that predate it just execute a trailing comment. Must match
+/// `_ERYX_NO_TRACE_PRAGMA` in eryx-wasm-runtime.
+const NO_TRACE_PRAGMA: &str = "\n#eryx:no-trace";
+
+/// Build the code string for the guest's `execute` export, marking untraced runs.
+pub(crate) fn guest_code(code: &str, traced: bool) -> String {
+    if traced {
+        if code.ends_with(NO_TRACE_PRAGMA) {
+            // User code that happens to end with the pragma must not switch
+            // tracing off; a trailing newline keeps it an ordinary comment.
+            let mut guest = code.to_string();
+            guest.push('\n');
+            return guest;
+        }
+        code.to_string()
+    } else {
+        let mut guest = String::with_capacity(code.len() + NO_TRACE_PRAGMA.len());
+        guest.push_str(code);
+        guest.push_str(NO_TRACE_PRAGMA);
+        guest
+    }
+}
+
 /// The result a callback handler sends back to the `invoke` host import.
 ///
 /// Distinguishes a successful result and an ordinary error (both surface to
@@ -2423,8 +2450,8 @@ impl PythonExecutor {
             None::<Arc<AtomicBool>>
         };
 
-        // Call the async execute export
-        let code_owned = code.to_string();
+        // Call the async execute export, telling the guest whether to trace
+        let code_owned = guest_code(code, store.data().trace_tx.is_some());
 
         // run_concurrent returns Result<R, Error> where R is the closure's return type.
         // Wrap in tokio::time::timeout so that blocking WASI host calls (e.g. poll_oneoff
@@ -2606,6 +2633,26 @@ pub fn parse_trace_event(request: &TraceRequest) -> std::result::Result<TraceEve
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_guest_code_traced_is_unchanged() {
+        assert_eq!(guest_code("x = 1", true), "x = 1");
+        assert_eq!(guest_code("x = 1\n# done\n", true), "x = 1\n# done\n");
+    }
+
+    #[test]
+    fn test_guest_code_untraced_appends_pragma() {
+        assert_eq!(guest_code("x = 1", false), "x = 1\n#eryx:no-trace");
+        assert_eq!(guest_code("# done", false), "# done\n#eryx:no-trace");
+        assert_eq!(guest_code("", false), "\n#eryx:no-trace");
+    }
+
+    #[test]
+    fn test_guest_code_traced_user_pragma_keeps_tracing() {
+        let guest = guest_code("x = 1\n#eryx:no-trace", true);
+        assert!(!guest.ends_with(NO_TRACE_PRAGMA));
+        assert_eq!(guest, "x = 1\n#eryx:no-trace\n");
+    }
+
     #[test]
     fn test_parse_trace_event_line() {
         let request = TraceRequest {
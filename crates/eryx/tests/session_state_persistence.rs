@@ -656,6 +656,250 @@ class Point:
     assert_eq!(output.stdout, "13.0");
 }
 
+/// Test that a snapshot taken after a mutation reflects it rather than reusing
+/// the bytes cached for the earlier snapshot.
+#[tokio::test]
+async fn test_snapshot_after_mutation_differs() {
+    let mut session = create_session().await;
+
+    session
+        .execute("x = 1")
+        .run()
+        .await
+        .expect("Failed to set x");
+    let before = session.snapshot_state().await.expect("Failed to snapshot");
+
+    // No execution in between: the cached bytes are returned unchanged.
+    let again = session.snapshot_state().await.expect("Failed to snapshot");
+    assert_eq!(again.data(), before.data());
+
+    session
+        .execute("x = 2")
+        .run()
+        .await
+        .expect("Failed to set x");
+    let after = session.snapshot_state().await.expect("Failed to snapshot");
+    assert_ne!(
+        after.data(),
+        before.data(),
+        "snapshot after a mutation must not reuse the earlier bytes"
+    );
+
+    session.clear_state().await.expect("Failed to clear");
+    session
+        .restore_state(&after)
+        .await
+        .expect("Failed to restore");
+    let output = session
+        .execute("print(x)")
+        .run()
+        .await
+        .expect("Failed to read x");
+    assert_eq!(output.stdout, "2");
+}
+
+/// Test that a snapshot taken after restore_state() round-trips the restored
+/// state rather than the state cached before the restore.
+#[tokio::test]
+async fn test_snapshot_after_restore_roundtrips() {
+    let mut session = create_session().await;
+
+    session
+        .execute("x = 1")
+        .run()
+        .await
+        .expect("Failed to set x");
+    let first = session.snapshot_state().await.expect("Failed to snapshot");
+
+    session
+        .execute("x = 2")
+        .run()
+        .await
+        .expect("Failed to set x");
+    let second = session.snapshot_state().await.expect("Failed to snapshot");
+    assert_ne!(second.data(), first.data());
+
+    session
+        .restore_state(&first)
+        .await
+        .expect("Failed to restore");
+    let restored = session.snapshot_state().await.expect("Failed to snapshot");
+    assert_eq!(
+        restored.data(),
+        first.data(),
+        "snapshot after restore must match the restored snapshot"
+    );
+}
+
+/// Test that a snapshot taken after clear_state() is empty rather than the
+/// state cached before the clear.
+#[tokio::test]
+async fn test_snapshot_after_clear_is_empty() {
+    let mut session = create_session().await;
+    let empty = session.snapshot_state().await.expect("Failed to snapshot");
+
+    session
+        .execute("x = 1")
+        .run()
+        .await
+        .expect("Failed to set x");
+    let populated = session.snapshot_state().await.expect("Failed to snapshot");
+    assert_ne!(populated.data(), empty.data());
+
+    session.clear_state().await.expect("Failed to clear");
+    let cleared = session.snapshot_state().await.expect("Failed to snapshot");
+    assert_eq!(
+        cleared.data(),
+        empty.data(),
+        "snapshot after clear_state must be empty"
+    );
+}
+
+/// Test that untraced code ending in a comment, with or without a trailing
+/// newline, runs unchanged with the no-trace marker appended.
+#[tokio::test]
+async fn test_untraced_trailing_comment() {
+    let mut session = create_session().await;
+
+    for code in [
+        "print('a')\n# trailing comment",
+        "print('a')\n# trailing comment\n",
+        "print('a')  # no newline",
+        "print('a')",
+    ] {
+        let output = session
+            .execute(code)
+            .run()
+            .await
+            .unwrap_or_else(|e| panic!("Failed to execute {code:?}: {e}"));
+        assert_eq!(output.stdout, "a", "unexpected output for {code:?}");
+    }
+}
+
+/// Test that user code containing the no-trace marker itself runs unchanged,
+/// untraced and traced, and doesn't switch tracing off when traced.
+#[tokio::test]
+async fn test_user_no_trace_marker() {
+    let mut session = create_session().await;
+
+    for code in [
+        "x = 1\n#eryx:no-trace\nprint(x)",
+        "x = 1\nprint(x)\n#eryx:no-trace",
+    ] {
+        let output = session
+            .execute(code)
+            .run()
+            .await
+            .unwrap_or_else(|e| panic!("Failed to execute {code:?}: {e}"));
+        assert_eq!(output.stdout, "1", "unexpected output for {code:?}");
+
+        let (trace_tx, mut trace_rx) = tokio::sync::mpsc::unbounded_channel();
+        let output = session
+            .execute(code)
+            .with_tracing(trace_tx)
+            .run()
+            .await
+            .unwrap_or_else(|e| panic!("Failed to execute {code:?} traced: {e}"));
+        assert_eq!(output.stdout, "1", "unexpected traced output for {code:?}");
+
+        let mut lines = Vec::new();
+        while let Ok(request) = trace_rx.try_recv() {
+            if request.event_json.contains("\"line\"") {
+                lines.push(request.lineno);
+            }
+        }
+        assert!(
+            lines.contains(&1) && lines.contains(&2),
+            "expected line events for {code:?}, got {lines:?}"
+        );
+    }
+}
+
+/// Test that re-executing identical source (which may reuse a cached code
+/// object) sees the current globals, including after clear_state().
+#[tokio::test]
+async fn test_identical_source_sees_current_globals() {
+    let mut session = create_session().await;
+
+    for (value, expected) in [("x = 1", "1"), ("x = 2", "2")] {
+        session
+            .execute(value)
+            .run()
+            .await
+            .unwrap_or_else(|e| panic!("Failed to execute {value:?}: {e}"));
+        let output = session
+            .execute("print(x)")
+            .run()
+            .await
+            .expect("Failed to print x");
+        assert_eq!(output.stdout, expected);
+    }
+
+    let define = "def f():\n    return x * 10\nprint(f())";
+    let output = session
+        .execute(define)
+        .run()
+        .await
+        .expect("Failed to run f");
+    assert_eq!(output.stdout, "20");
+
+    session.clear_state().await.expect("Failed to clear");
+
+    // Same source again: it must fail against the cleared namespace...
+    assert!(session.execute("print(x)").run().await.is_err());
+    assert!(session.execute(define).run().await.is_err());
+
+    // ...and bind to the new globals once they exist.
+    session
+        .execute("x = 3")
+        .run()
+        .await
+        .expect("Failed to set x");
+    let output = session
+        .execute(define)
+        .run()
+        .await
+        .expect("Failed to run f");
+    assert_eq!(output.stdout, "30");
+    let output = session
+        .execute("print(x)")
+        .run()
+        .await
+        .expect("Failed to print x");
+    assert_eq!(output.stdout, "3");
+}
+
+/// Test that sources over the compile cache's size limit still execute, and
+/// re-execute against the current globals.
+#[tokio::test]
+async fn test_large_source_executes() {
+    let mut session = create_session().await;
+
+    let mut code = String::from("total = start\n");
+    for _ in 0..1000 {
+        code.push_str("total += 1\n");
+    }
+    code.push_str("print(total)");
+    assert!(
+        code.len() > 4096,
+        "source must exceed the compile cache limit"
+    );
+
+    for (start, expected) in [("start = 0", "1000"), ("start = 5", "1005")] {
+        session
+            .execute(start)
+            .run()
+            .await
+            .unwrap_or_else(|e| panic!("Failed to execute {start:?}: {e}"));
+        let output = session
+            .execute(code.as_str())
+            .run()
+            .await
+            .expect("Failed to run large source");
+        assert_eq!(output.stdout, expected);
+    }
+}
+
 /// The `result` variable is captured per-execution and consumed afterward, so a
 /// later run in the same (persistent) session that does not set it reports no
 /// result rather than re-reporting the stale value.